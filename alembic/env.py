@@ -10,7 +10,7 @@ from alembic import context
 from app.database import Base
 from app.models import (
     User, Session, UserSession, Team, TeamMember,
-    Reservation, ReservationParticipant, Notice,
+    Reservation, ReservationParticipant, ReservationSeries, Notice, Room,
 )
 
 load_dotenv()
@@ -0,0 +1,63 @@
+"""rooms
+
+Revision ID: 047ae2c75c64
+Revises: d9b4349933f5
+Create Date: 2026-10-17 16:41:05.318274
+
+합주실(rooms) 테이블과 reservations.room_id.
+같은 합주실의 예약 시간이 겹치지 않도록 EXCLUDE USING gist 제약을 건다.
+(room_id = 비교를 gist로 하려면 btree_gist 확장이 필요하다 — PG13+에서는 DB 소유자가 설치 가능)
+
+기존 예약은 room_id가 NULL이라 제약 검사 대상이 아니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '047ae2c75c64'
+down_revision: Union[str, None] = 'd9b4349933f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.create_table('rooms',
+    sa.Column('room_id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('room_id'),
+    sa.UniqueConstraint('name')
+    )
+    op.add_column('reservation_series', sa.Column('room_id', sa.BigInteger(), nullable=True))
+    op.create_foreign_key(
+        'reservation_series_room_id_fkey', 'reservation_series', 'rooms', ['room_id'], ['room_id'],
+    )
+    op.add_column('reservations', sa.Column('room_id', sa.BigInteger(), nullable=True))
+    op.create_foreign_key(
+        'reservations_room_id_fkey', 'reservations', 'rooms', ['room_id'], ['room_id'],
+    )
+    op.create_check_constraint(
+        'ck_reservations_room_time_order', 'reservations', 'room_id IS NULL OR start_time < end_time',
+    )
+    op.execute(
+        'ALTER TABLE reservations ADD CONSTRAINT ex_reservations_room_time '
+        'EXCLUDE USING gist (room_id WITH =, '
+        'tsrange(reservation_date + start_time, reservation_date + end_time) WITH &&) '
+        "WHERE (room_id IS NOT NULL AND status <> 'cancelled')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_reservations_room_time', 'reservations')
+    op.drop_constraint('ck_reservations_room_time_order', 'reservations', type_='check')
+    op.drop_constraint('reservations_room_id_fkey', 'reservations', type_='foreignkey')
+    op.drop_column('reservations', 'room_id')
+    op.drop_constraint('reservation_series_room_id_fkey', 'reservation_series', type_='foreignkey')
+    op.drop_column('reservation_series', 'room_id')
+    op.drop_table('rooms')
@@ -0,0 +1,37 @@
+"""notice keyset index
+
+Revision ID: 0edf69a761bb
+Revises: 6841efb1f623
+Create Date: 2026-10-17 13:40:07.532918
+
+공지 목록 keyset 페이지네이션 정렬 키 (created_at DESC, notice_id DESC)에 맞춘 복합 인덱스.
+created_at 단일 인덱스는 이 인덱스의 선행 컬럼으로 대체된다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0edf69a761bb'
+down_revision: Union[str, None] = '6841efb1f623'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notices_created_at_notice_id', 'notices',
+            [sa.text('created_at DESC'), sa.text('notice_id DESC')], postgresql_concurrently=True,
+        )
+        op.drop_index('ix_notices_created_at', table_name='notices', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notices_created_at', 'notices',
+            [sa.text('created_at DESC')], postgresql_concurrently=True,
+        )
+        op.drop_index('ix_notices_created_at_notice_id', table_name='notices', postgresql_concurrently=True)
@@ -0,0 +1,53 @@
+"""hot path indexes
+
+Revision ID: 6841efb1f623
+Revises: ba649b7e5098
+Create Date: 2026-10-17 13:02:51.640327
+
+운영 중인 테이블을 잠그지 않도록 CREATE INDEX CONCURRENTLY로 만든다.
+(트랜잭션 안에서 실행할 수 없으므로 autocommit_block 사용)
+
+team_members.team_id, reservation_participants.reservation_id 조회는
+기존 UNIQUE(team_id, user_id), UNIQUE(reservation_id, user_id) 인덱스의
+선행 컬럼으로 이미 처리되므로 별도 인덱스를 만들지 않는다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '6841efb1f623'
+down_revision: Union[str, None] = 'ba649b7e5098'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_reservation_date_start_time', 'reservations',
+            ['reservation_date', 'start_time'], postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_notices_created_at', 'notices',
+            [sa.text('created_at DESC')], postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_sessions_user_id_is_main', 'user_sessions',
+            ['user_id', 'is_main'], postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_nickname', 'users',
+            ['nickname'], postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_nickname', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_user_sessions_user_id_is_main', table_name='user_sessions', postgresql_concurrently=True)
+        op.drop_index('ix_notices_created_at', table_name='notices', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_reservations_reservation_date_start_time', table_name='reservations', postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""notice search indexes
+
+Revision ID: 7789f0a28322
+Revises: 047ae2c75c64
+Create Date: 2026-10-17 17:32:10.482913
+
+공지 검색(GET /api/notices/search)용 title, content trigram GIN 인덱스.
+검색은 word_similarity 연산자(`검색어 <% 컬럼`)를 쓴다. 단어 앞뒤 공백을 포함한 trigram으로 비교하므로
+ILIKE '%검색어%'와 달리 2글자 한글 단어도 인덱스로 후보를 좁힌다.
+(pg_trgm은 DB의 LC_CTYPE 기준으로 문자를 구분 → UTF-8 로케일에서 한글이 인덱싱된다)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7789f0a28322'
+down_revision: Union[str, None] = '047ae2c75c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notices_title_trgm', 'notices', ['title'],
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_notices_content_trgm', 'notices', ['content'],
+            postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_notices_content_trgm', table_name='notices', postgresql_concurrently=True)
+        op.drop_index('ix_notices_title_trgm', table_name='notices', postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""user directory indexes
+
+Revision ID: 7c585f370aa4
+Revises: 0edf69a761bb
+Create Date: 2026-10-17 14:05:33.904211
+
+- (nickname, user_id): 멤버 목록 keyset 페이지네이션 정렬 키 (nickname 단일 인덱스 대체)
+- nickname, affiliation trigram GIN: ILIKE '%검색어%' 부분 검색용
+  pg_trgm은 DB의 LC_CTYPE 기준으로 문자를 구분하므로 UTF-8 로케일(Supabase 기본값)에서 한글이 인덱싱된다.
+  3글자 미만 검색어는 trigram을 만들 수 없어 인덱스 효과가 작다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7c585f370aa4'
+down_revision: Union[str, None] = '0edf69a761bb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_nickname_user_id', 'users',
+            ['nickname', 'user_id'], postgresql_concurrently=True,
+        )
+        op.drop_index('ix_users_nickname', table_name='users', postgresql_concurrently=True)
+        op.create_index(
+            'ix_users_nickname_trgm', 'users', ['nickname'],
+            postgresql_using='gin', postgresql_ops={'nickname': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_affiliation_trgm', 'users', ['affiliation'],
+            postgresql_using='gin', postgresql_ops={'affiliation': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_affiliation_trgm', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_nickname_trgm', table_name='users', postgresql_concurrently=True)
+        op.create_index(
+            'ix_users_nickname', 'users',
+            ['nickname'], postgresql_concurrently=True,
+        )
+        op.drop_index('ix_users_nickname_user_id', table_name='users', postgresql_concurrently=True)
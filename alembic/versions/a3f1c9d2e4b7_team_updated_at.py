@@ -0,0 +1,27 @@
+"""team updated_at
+
+Revision ID: a3f1c9d2e4b7
+Revises: 7c585f370aa4
+Create Date: 2026-10-17 15:20:11.482913
+
+팀 목록 ETag(버전 스탬프)용. 팀 정보 수정과 멤버 추가/삭제 시 갱신한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a3f1c9d2e4b7'
+down_revision: Union[str, None] = '7c585f370aa4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('teams', sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.execute('UPDATE teams SET updated_at = created_at')
+
+
+def downgrade() -> None:
+    op.drop_column('teams', 'updated_at')
@@ -0,0 +1,44 @@
+"""reservation participant_count
+
+Revision ID: ba649b7e5098
+Revises: 335c74951dee
+Create Date: 2026-10-17 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'ba649b7e5098'
+down_revision: Union[str, None] = '335c74951dee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('reservations', sa.Column('participant_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 confirmed 참가자 수로 채운다
+    op.execute(
+        """
+        UPDATE reservations AS r
+        SET participant_count = p.cnt
+        FROM (
+            SELECT reservation_id, count(*) AS cnt
+            FROM reservation_participants
+            WHERE status = 'confirmed'
+            GROUP BY reservation_id
+        ) AS p
+        WHERE r.reservation_id = p.reservation_id
+        """
+    )
+    op.create_check_constraint(
+        'ck_reservations_participant_count_nonnegative', 'reservations', 'participant_count >= 0'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_reservations_participant_count_nonnegative', 'reservations', type_='check')
+    op.drop_column('reservations', 'participant_count')
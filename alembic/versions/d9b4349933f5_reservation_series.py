@@ -0,0 +1,56 @@
+"""reservation series
+
+Revision ID: d9b4349933f5
+Revises: a3f1c9d2e4b7
+Create Date: 2026-10-17 15:58:40.215733
+
+반복 예약(매주/격주). 각 회차는 reservations 행이며 series_id로 규칙과 연결된다.
+기존 예약은 series_id가 NULL인 단건 예약으로 남는다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'd9b4349933f5'
+down_revision: Union[str, None] = 'a3f1c9d2e4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reservation_series',
+    sa.Column('series_id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('created_by', sa.BigInteger(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('frequency', sa.String(length=20), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('until_date', sa.Date(), nullable=False),
+    sa.Column('exception_dates', postgresql.ARRAY(sa.Date()), server_default='{}', nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('location', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('max_participants', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('series_id')
+    )
+    op.add_column('reservations', sa.Column('series_id', sa.BigInteger(), nullable=True))
+    op.create_foreign_key(
+        'reservations_series_id_fkey', 'reservations', 'reservation_series', ['series_id'], ['series_id'],
+    )
+    # 새 컬럼이라 전부 NULL → 잠금 시간이 짧으므로 CONCURRENTLY 없이 만든다
+    op.create_index(
+        'ix_reservations_series_id_reservation_date', 'reservations', ['series_id', 'reservation_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservations_series_id_reservation_date', table_name='reservations')
+    op.drop_constraint('reservations_series_id_fkey', 'reservations', type_='foreignkey')
+    op.drop_column('reservations', 'series_id')
+    op.drop_table('reservation_series')
@@ -1,9 +1,62 @@
+import time
+from uuid import uuid4
+
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=True)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기 시간과 타임아웃 횟수를 집계하는 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def _engine_options() -> dict:
+    connect_args = {}
+    if settings.db_pgbouncer:
+        # PgBouncer/Supavisor transaction 모드에서는 요청마다 서버 커넥션이 바뀌므로
+        # prepared statement를 캐시하지 않고, 이름이 겹치지 않게 매번 새로 만든다
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    else:
+        connect_args["prepared_statement_cache_size"] = settings.db_statement_cache_size
+
+    return {
+        "echo": settings.db_echo,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+engine = create_async_engine(settings.database_url, **_engine_options())
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -14,3 +67,23 @@ class Base(DeclarativeBase):
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+def pool_status() -> dict:
+    """현재 워커의 커넥션 풀 상태"""
+    pool = engine.pool
+    status = {
+        "pool_size": pool.size(),
+        "max_overflow": settings.db_max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_ms_avg=round(pool.wait_seconds_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+            wait_ms_max=round(pool.wait_seconds_max * 1000, 3),
+        )
+    return status
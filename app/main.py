@@ -1,13 +1,45 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.routers import auth, users, sessions, reservations, teams, notices
+from app.database import async_session, engine
+from app.routers import auth, users, sessions, reservations, rooms, teams, notices, system
+from app.services import kakao
+from app.services.invalidation import bus as invalidation_bus
+from app.services.session_catalog import load_catalog
+from app.services.metrics import MetricsMiddleware, metrics_lifespan, metrics_response, require_metrics_token
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.services.query_stats import QUERY_COUNT_HEADER, QUERY_TIME_HEADER, QueryStatsMiddleware, instrument_engine
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await kakao.start_client()
+    await invalidation_bus.start()
+    try:
+        async with async_session() as db:
+            await load_catalog(db)
+    except Exception:
+        # DB가 아직 준비되지 않았어도 기동은 계속한다 (첫 사용 시 다시 읽는다)
+        logger.exception("세션 카탈로그 로드 실패")
+    async with metrics_lifespan():
+        yield
+    await invalidation_bus.stop()
+    await kakao.close_client()
+    await engine.dispose()
+
 
 app = FastAPI(
     title="게더올어라운드 총괄 프로그램 API",
     description="밴드 합주 예약 및 커뮤니티 관리 시스템",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -16,16 +48,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
 )
 
+# 요청별 SQL 실행 수/시간 집계 (느린 쿼리 로그, DEBUG 시 응답 헤더)
+instrument_engine(engine.sync_engine)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(auth.router, prefix="/api/auth", tags=["Auth"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
 app.include_router(sessions.router, prefix="/api/sessions", tags=["Sessions"])
 app.include_router(reservations.router, prefix="/api/reservations", tags=["Reservations"])
+app.include_router(rooms.router, prefix="/api/rooms", tags=["Rooms"])
 app.include_router(teams.router, prefix="/api/teams", tags=["Teams"])
 app.include_router(notices.router, prefix="/api/notices", tags=["Notices"])
+app.include_router(system.router, prefix="/api/system", tags=["System"])
 
 
 @app.get("/")
 async def root():
     return {"message": "GAA ERP API is running"}
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """Prometheus 메트릭 (텍스트 형식, METRICS_TOKEN Bearer 인증)"""
+    return metrics_response()
@@ -1,8 +1,9 @@
 from app.models.user import User
 from app.models.session import Session, UserSession
 from app.models.team import Team, TeamMember
-from app.models.reservation import Reservation, ReservationParticipant
+from app.models.reservation import Reservation, ReservationParticipant, ReservationSeries
 from app.models.notice import Notice
+from app.models.room import Room
 
 __all__ = [
     "User",
@@ -12,5 +13,7 @@ __all__ = [
     "TeamMember",
     "Reservation",
     "ReservationParticipant",
+    "ReservationSeries",
     "Notice",
+    "Room",
 ]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, ForeignKey, String, Text, func
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -8,6 +8,21 @@ from app.database import Base
 
 class Notice(Base):
     __tablename__ = "notices"
+    __table_args__ = (
+        # 공지 검색(GET /api/notices/search, word_similarity `<%`)용 trigram 인덱스
+        Index(
+            "ix_notices_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_notices_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
 
     notice_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     author_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.user_id"), nullable=False)
@@ -17,3 +32,6 @@ class Notice(Base):
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
 
     author = relationship("User", back_populates="notices")
+
+
+Index("ix_notices_created_at_notice_id", Notice.created_at.desc(), Notice.notice_id.desc())
@@ -1,13 +1,56 @@
 from datetime import date, datetime, time
 
-from sqlalchemy import BigInteger, Date, ForeignKey, Integer, String, Text, Time, UniqueConstraint, func
+from sqlalchemy import BigInteger, CheckConstraint, Date, ForeignKey, Index, Integer, String, Text, Time, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+class ReservationSeries(Base):
+    """반복 예약 규칙 (매주/격주) — 각 회차는 series_id로 연결된 reservations 행"""
+
+    __tablename__ = "reservation_series"
+
+    series_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    created_by: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.user_id"), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    frequency: Mapped[str] = mapped_column(String(20), nullable=False)  # weekly/biweekly
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    until_date: Mapped[date] = mapped_column(Date, nullable=False)
+    exception_dates: Mapped[list[date]] = mapped_column(ARRAY(Date), nullable=False, server_default="{}")
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+    location: Mapped[str | None] = mapped_column(Text, nullable=True)
+    room_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("rooms.room_id"), nullable=True)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    max_participants: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
+
+    reservations = relationship("Reservation", back_populates="series")
+
+
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_reservation_date_start_time", "reservation_date", "start_time"),
+        # "이후 회차 모두" 수정/삭제 (series_id = ? AND reservation_date >= ?)
+        Index("ix_reservations_series_id_reservation_date", "series_id", "reservation_date"),
+        # 합주실 예약은 시간 범위(tsrange)로 비교하므로 종료가 시작보다 늦어야 한다
+        CheckConstraint("room_id IS NULL OR start_time < end_time", name="ck_reservations_room_time_order"),
+        # 참가자 수 카운터가 어긋나면 조용히 정원 검사를 무력화하지 않고 쓰기가 실패하도록
+        CheckConstraint("participant_count >= 0", name="ck_reservations_participant_count_nonnegative"),
+        # 같은 합주실의 예약 시간이 겹치면 DB가 INSERT/UPDATE를 거부한다 (23P01, btree_gist 필요)
+        # 취소된 예약과 합주실을 지정하지 않은 예약은 검사하지 않는다
+        ExcludeConstraint(
+            ("room_id", "="),
+            (text("tsrange(reservation_date + start_time, reservation_date + end_time)"), "&&"),
+            name="ex_reservations_room_time",
+            using="gist",
+            where=text("room_id IS NOT NULL AND status <> 'cancelled'"),
+        ),
+    )
 
     reservation_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     created_by: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.user_id"), nullable=False)
@@ -16,14 +59,22 @@ class Reservation(Base):
     start_time: Mapped[time] = mapped_column(Time, nullable=False)
     end_time: Mapped[time] = mapped_column(Time, nullable=False)
     location: Mapped[str | None] = mapped_column(Text, nullable=True)
+    room_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("rooms.room_id"), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False, server_default="open")
     max_participants: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # confirmed 참가자 수 (참가/취소 시 원자적으로 증감)
+    participant_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    series_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("reservation_series.series_id"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
 
     creator = relationship("User", back_populates="created_reservations")
     participants = relationship("ReservationParticipant", back_populates="reservation")
+    series = relationship("ReservationSeries", back_populates="reservations")
+    room = relationship("Room", back_populates="reservations")
 
 
 class ReservationParticipant(Base):
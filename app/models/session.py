@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, Boolean, ForeignKey, Numeric, String, UniqueConstraint, func
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, Numeric, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -19,7 +19,10 @@ class Session(Base):
 
 class UserSession(Base):
     __tablename__ = "user_sessions"
-    __table_args__ = (UniqueConstraint("user_id", "session_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "session_id"),
+        Index("ix_user_sessions_user_id_is_main", "user_id", "is_main"),
+    )
 
     user_session_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.user_id"), nullable=False)
@@ -13,6 +13,8 @@ class Team(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+    # 팀 정보 수정, 멤버 추가/삭제 시 갱신 (목록 ETag용)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now(), onupdate=func.now())
 
     members = relationship("TeamMember", back_populates="team")
 
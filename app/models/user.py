@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, String, Text, func
+from sqlalchemy import BigInteger, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -8,6 +8,22 @@ from app.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_nickname_user_id", "nickname", "user_id"),
+        # 닉네임/소속 부분 검색(ILIKE '%q%')용 trigram 인덱스
+        Index(
+            "ix_users_nickname_trgm",
+            "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_affiliation_trgm",
+            "affiliation",
+            postgresql_using="gin",
+            postgresql_ops={"affiliation": "gin_trgm_ops"},
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     kakao_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
@@ -1,52 +1,158 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import Text, case, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.notice import Notice
 from app.models.user import User
-from app.schemas.notice import NoticeCreate, NoticeResponse, NoticeUpdate
+from app.schemas.notice import NoticeCreate, NoticeListItem, NoticeResponse, NoticeSearchResult, NoticeUpdate
 from app.services.auth import get_current_user
+from app.services.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.services.notice_search import notice_search_query
+from app.services.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.services.search import highlight, snippet
+from app.services.serialization import dump_json, dump_rows, json_response, schema_columns
 
 router = APIRouter()
 
+# 공지 목록은 짧게 캐시하고 이후 ETag로 재검증
+NOTICES_CACHE_CONTROL = "private, max-age=30"
+
+# 목록에 보여줄 본문 발췌 길이 (글자 수)
+NOTICE_EXCERPT_LENGTH = 100
+
+
+def _excerpt_column():
+    """
+    본문 앞부분을 한 줄로 줄인 발췌 (길면 끝에 "…")
+    substr은 TOAST된 긴 본문에서 앞부분만 읽는다. (left()는 본문 전체를 풀어 읽은 뒤 자른다)
+    """
+    head = func.substr(Notice.content, 1, NOTICE_EXCERPT_LENGTH + 1)
+    line = func.btrim(func.regexp_replace(head, r"\s+", " ", "g"))
+    return case(
+        (func.char_length(head) > NOTICE_EXCERPT_LENGTH, func.rtrim(func.left(line, NOTICE_EXCERPT_LENGTH), type_=Text) + "…"),
+        else_=line,
+    )
+
+
+# 공지 목록은 Row → JSON 바이트로 바로 직렬화한다 (NoticeListItem 필드 순서)
+# 본문 전체는 읽지 않는다 → 긴 공지가 있어도 목록 응답/DB I/O가 커지지 않는다
+NOTICE_LIST_COLUMNS = schema_columns(
+    NoticeListItem,
+    notice_id=Notice.notice_id,
+    author_id=Notice.author_id,
+    author_nickname=User.nickname,
+    title=Notice.title,
+    excerpt=_excerpt_column(),
+    created_at=Notice.created_at,
+    updated_at=Notice.updated_at,
+)
+
 
 def require_admin(user: User):
     if user.role not in ("admin", "root"):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다")
 
 
-@router.get("/", response_model=list[NoticeResponse])
+@router.get("/", response_model=list[NoticeListItem])
 async def get_notices(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 값 (지정 시 page 무시)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """공지사항 목록 조회 (페이지네이션)"""
-    offset = (page - 1) * size
+    """
+    공지사항 목록 조회 (페이지네이션)
+    본문은 앞부분 발췌(excerpt)만 내려준다. 전체 본문은 GET /api/notices/{notice_id}로 조회한다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려준다.
+    cursor를 넘기면 (created_at, notice_id) 기준 keyset 방식으로 조회하므로 깊은 페이지도 느려지지 않는다.
+    ETag는 공지 전체의 버전 스탬프라 페이지와 관계없이 공지가 바뀌면 함께 바뀐다. (If-None-Match 일치 시 304)
+    """
+    # 버전 스탬프: 공지 수 + 공지/작성자(닉네임) 최종 수정 시각
+    stamp = (
+        await db.execute(
+            select(func.count(), func.max(Notice.updated_at), func.max(User.updated_at))
+            .select_from(Notice)
+            .join(User, Notice.author_id == User.user_id)
+        )
+    ).one()
+    # 응답 형식(발췌)이 바뀐 스탬프와 구분되도록 "notice-list" 접두어를 쓴다
+    etag = make_etag("notice-list", *stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag, NOTICES_CACHE_CONTROL)
 
-    result = await db.execute(
-        select(Notice, User.nickname)
+    query = (
+        select(*NOTICE_LIST_COLUMNS)
+        .select_from(Notice)
         .join(User, Notice.author_id == User.user_id)
-        .order_by(Notice.created_at.desc())
-        .offset(offset)
-        .limit(size)
+        .order_by(Notice.created_at.desc(), Notice.notice_id.desc())
     )
+    if cursor is not None:
+        created_at, notice_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        query = query.where(tuple_(Notice.created_at, Notice.notice_id) < (created_at, notice_id))
+    else:
+        query = query.offset((page - 1) * size)
+
+    result = await db.execute(query.limit(size + 1))
     rows = result.all()
 
-    return [
-        NoticeResponse(
-            notice_id=notice.notice_id,
-            author_id=notice.author_id,
-            author_nickname=nickname,
-            title=notice.title,
-            content=notice.content,
-            created_at=notice.created_at,
-            updated_at=notice.updated_at,
-        )
-        for notice, nickname in rows
+    headers = {}
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.notice_id)
+
+    response = json_response(dump_rows(rows), headers=headers)
+    set_cache_headers(response, etag, NOTICES_CACHE_CONTROL)
+    return response
+
+
+@router.get("/search", response_model=list[NoticeSearchResult])
+async def search_notices(
+    q: str = Query(..., min_length=2, max_length=100, description="검색어 (제목/본문)"),
+    size: int = Query(20, ge=1, le=50),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    공지사항 검색 (제목/본문 trigram 유사도 순)
+    title_highlight, snippet은 검색어를 <mark>로 감싼 HTML 조각이다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려준다. ((rank, notice_id) 기준 keyset)
+    """
+    q = " ".join(q.split())
+    if len(q) < 2:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="검색어는 2글자 이상이어야 합니다")
+
+    after = decode_cursor(cursor, float, int) if cursor is not None else None
+    result = await db.execute(notice_search_query(q, after).limit(size + 1))
+    rows = result.all()
+
+    headers = {}
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.rank, last.notice_id)
+
+    items = [
+        {
+            "notice_id": row.notice_id,
+            "author_id": row.author_id,
+            "author_nickname": row.author_nickname,
+            "title": row.title,
+            "title_highlight": highlight(row.title, q),
+            "snippet": snippet(row.content, q),
+            "rank": round(row.rank, 4),
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
+        for row in rows
     ]
+    return json_response(dump_json(items), headers=headers)
 
 
 @router.post("/", response_model=NoticeResponse, status_code=status.HTTP_201_CREATED)
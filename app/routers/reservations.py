@@ -1,83 +1,128 @@
-from datetime import date
+from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import BigInteger, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.config import settings
 from app.database import get_db
-from app.models.reservation import Reservation, ReservationParticipant
+from app.models.reservation import Reservation, ReservationParticipant, ReservationSeries
+from app.models.room import Room
 from app.models.user import User
 from app.schemas.reservation import (
+    AvailabilitySlot,
     ReservationCreate,
     ReservationDetailResponse,
     ReservationResponse,
+    ReservationSeriesCreate,
+    ReservationSeriesResponse,
+    ReservationSeriesUpdate,
     ReservationUpdate,
+    StreamTokenResponse,
 )
 from app.services.auth import get_current_user
+from app.services.availability import busy_intervals_query, free_slots
+from app.services.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.services.jwt import create_stream_token, verify_access_token, verify_stream_token
+from app.services.recurrence import occurrence_dates
+from app.services.reservation_cache import invalidate_months, month_cache
+from app.services.reservation_events import broker, publish, reservation_event, stream_frames
+from app.services.rooms import raise_for_room_error
+from app.services.serialization import dump_json, dump_rows, json_response, schema_columns
 
 router = APIRouter()
 
+# 참가/취소로 자주 바뀌므로 매번 ETag로 재검증
+MONTH_CACHE_CONTROL = "private, no-cache"
+
+# 월별 목록은 Row → JSON 바이트로 바로 직렬화한다 (ReservationResponse 필드 순서)
+RESERVATION_LIST_COLUMNS = schema_columns(
+    ReservationResponse,
+    reservation_id=Reservation.reservation_id,
+    created_by=Reservation.created_by,
+    creator_nickname=User.nickname,
+    title=Reservation.title,
+    reservation_date=Reservation.reservation_date,
+    start_time=Reservation.start_time,
+    end_time=Reservation.end_time,
+    location=Reservation.location,
+    room_id=Reservation.room_id,
+    description=Reservation.description,
+    status=Reservation.status,
+    max_participants=Reservation.max_participants,
+    participant_count=Reservation.participant_count,
+    series_id=Reservation.series_id,
+    created_at=Reservation.created_at,
+    updated_at=Reservation.updated_at,
+)
+
+
+def _month_response(body: bytes, etag: str):
+    response = json_response(body)
+    set_cache_headers(response, etag, MONTH_CACHE_CONTROL)
+    return response
+
 
 @router.get("/", response_model=list[ReservationResponse])
 async def get_reservations(
+    request: Request,
     year: int = Query(..., description="조회 연도"),
     month: int = Query(..., ge=1, le=12, description="조회 월"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """예약 목록 조회 (월별, 캘린더용)"""
+    """
+    예약 목록 조회 (월별, 캘린더용)
+    ETag를 내려주며, If-None-Match가 같으면 목록을 만들지 않고 304를 반환한다.
+    응답 JSON은 Pydantic 모델 없이 조회 결과에서 바로 만들어 캐시한다. (스키마: ReservationResponse)
+    """
+    cached = month_cache.get((year, month))
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified(etag, MONTH_CACHE_CONTROL)
+        return _month_response(body, etag)
+
+    generation = month_cache.generation
     start_date = date(year, month, 1)
     if month == 12:
         end_date = date(year + 1, 1, 1)
     else:
         end_date = date(year, month + 1, 1)
 
-    # 참가자 수 서브쿼리
-    participant_count_subq = (
-        select(
-            ReservationParticipant.reservation_id,
-            func.count().label("participant_count"),
-        )
-        .where(ReservationParticipant.status == "confirmed")
-        .group_by(ReservationParticipant.reservation_id)
-        .subquery()
+    in_month = (
+        Reservation.reservation_date >= start_date,
+        Reservation.reservation_date < end_date,
     )
 
+    # 버전 스탬프: 예약 수 + 예약/생성자(닉네임) 최종 수정 시각 (참가/취소도 updated_at을 갱신한다)
+    stamp = (
+        await db.execute(
+            select(func.count(), func.max(Reservation.updated_at), func.max(User.updated_at))
+            .select_from(Reservation)
+            .join(User, Reservation.created_by == User.user_id)
+            .where(*in_month)
+        )
+    ).one()
+    etag = make_etag("reservations", year, month, *stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag, MONTH_CACHE_CONTROL)
+
     result = await db.execute(
-        select(Reservation, User.nickname, participant_count_subq.c.participant_count)
+        select(*RESERVATION_LIST_COLUMNS)
+        .select_from(Reservation)
         .join(User, Reservation.created_by == User.user_id)
-        .outerjoin(
-            participant_count_subq,
-            Reservation.reservation_id == participant_count_subq.c.reservation_id,
-        )
-        .where(
-            Reservation.reservation_date >= start_date,
-            Reservation.reservation_date < end_date,
-        )
+        .where(*in_month)
         .order_by(Reservation.reservation_date, Reservation.start_time)
     )
-    rows = result.all()
+    body = dump_rows(result.all())
 
-    return [
-        ReservationResponse(
-            reservation_id=r.reservation_id,
-            created_by=r.created_by,
-            creator_nickname=nickname,
-            title=r.title,
-            reservation_date=r.reservation_date,
-            start_time=r.start_time,
-            end_time=r.end_time,
-            location=r.location,
-            description=r.description,
-            status=r.status,
-            max_participants=r.max_participants,
-            participant_count=count or 0,
-            created_at=r.created_at,
-            updated_at=r.updated_at,
-        )
-        for r, nickname, count in rows
-    ]
+    month_cache.set((year, month), (etag, body), generation=generation)
+    return _month_response(body, etag)
 
 
 @router.post("/", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED)
@@ -94,14 +139,22 @@ async def create_reservation(
         start_time=data.start_time,
         end_time=data.end_time,
         location=data.location,
+        room_id=data.room_id,
         description=data.description,
         max_participants=data.max_participants,
     )
     db.add(reservation)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        # 합주실 시간 겹침 → 409
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    invalidate_months(reservation.reservation_date)
     await db.refresh(reservation)
 
-    return ReservationResponse(
+    response = ReservationResponse(
         reservation_id=reservation.reservation_id,
         created_by=reservation.created_by,
         creator_nickname=current_user.nickname,
@@ -110,13 +163,355 @@ async def create_reservation(
         start_time=reservation.start_time,
         end_time=reservation.end_time,
         location=reservation.location,
+        room_id=reservation.room_id,
         description=reservation.description,
         status=reservation.status,
         max_participants=reservation.max_participants,
-        participant_count=0,
+        participant_count=reservation.participant_count,
+        series_id=reservation.series_id,
         created_at=reservation.created_at,
         updated_at=reservation.updated_at,
     )
+    publish(
+        reservation_event(
+            "created", reservation.reservation_id, reservation.reservation_date, reservation=response.model_dump()
+        )
+    )
+    return response
+
+
+@router.post("/stream/token", response_model=StreamTokenResponse)
+async def create_stream_connect_token(current_user: User = Depends(get_current_user)):
+    """실시간 스트림 연결용 단기 토큰 발급 (EventSource URL의 ?token=에 넣는다)"""
+    return StreamTokenResponse(
+        token=create_stream_token(current_user.user_id),
+        expires_in=settings.stream_token_expire_seconds,
+    )
+
+
+@router.get("/stream")
+async def stream_reservation_events(
+    request: Request,
+    token: str | None = Query(None, description="POST /stream/token으로 받은 단기 토큰 (EventSource는 헤더를 보낼 수 없음)"),
+):
+    """
+    예약 변경 실시간 스트림 (Server-Sent Events)
+    월별 목록을 다시 조회하는 대신 생성/수정/삭제/참가자 수 변경 이벤트로 캘린더를 갱신한다.
+    연결이 오래 유지되므로 DB 세션 없이 토큰 서명만 검증한다.
+    재연결 시 브라우저가 보내는 Last-Event-ID 이후 이벤트를 다시 보내고, 알 수 없으면 resync 이벤트를 보낸다.
+
+    인증: 쿼리 문자열은 uvicorn/프록시 접근 로그에 그대로 남으므로 ?token=에는 access token을 받지 않고,
+    POST /stream/token으로 받은 단기 스트림 토큰(typ=stream, 기본 60초)만 받는다.
+    로그에 남은 토큰은 만료 전까지 이 스트림(읽기 전용)을 여는 데만 쓰일 수 있다.
+    만료는 연결할 때만 확인하므로 열린 스트림은 계속 유지되지만, 토큰이 만료된 뒤 자동 재연결하면 401이 난다
+    → 클라이언트는 연결이 끊기면(onerror) 새 토큰을 받아 EventSource를 다시 만든다.
+    헤더를 보낼 수 있는 클라이언트는 Authorization: Bearer <access token>으로 연결해도 된다.
+    """
+    if token is not None:
+        user_id = verify_stream_token(token)
+    else:
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        user_id = verify_access_token(credentials) if scheme.lower() == "bearer" and credentials else None
+    if user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다")
+    if broker.full:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="실시간 연결이 너무 많습니다")
+
+    return StreamingResponse(
+        stream_frames(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        # nginx 등 프록시가 응답을 모아 두지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/availability", response_model=list[AvailabilitySlot])
+async def get_availability(
+    from_: date = Query(..., alias="from", description="시작 날짜"),
+    to: date = Query(..., description="종료 날짜 (포함)"),
+    room: int | None = Query(None, description="합주실 ID (기본: 전체 합주실)"),
+    min_minutes: int = Query(60, ge=10, le=24 * 60, description="최소 빈 시간(분)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    합주실 빈 시간 조회 (기간 내 날짜별, 운영 시간 기준)
+    사용 중인 시간대를 인덱스 조회 한 번으로 가져와 정렬된 구간을 훑으며 빈틈을 계산한다.
+    """
+    if to < from_:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="종료 날짜가 시작 날짜보다 빠릅니다")
+    if (to - from_).days + 1 > settings.availability_max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 최대 {settings.availability_max_days}일입니다",
+        )
+
+    if room is not None:
+        if await db.get(Room, room) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="합주실을 찾을 수 없습니다")
+        room_ids = [room]
+    else:
+        room_ids = (await db.execute(select(Room.room_id).order_by(Room.room_id))).scalars().all()
+
+    # 학기 단위면 수천~수만 행 → ORM 결과 처리를 거치지 않도록 세션의 Core 커넥션으로 조회
+    connection = await db.connection()
+    busy = (await connection.execute(busy_intervals_query(from_, to, room))).all()
+    slots = free_slots(
+        busy,
+        room_ids,
+        from_,
+        to,
+        settings.availability_day_start,
+        settings.availability_day_end,
+        min_minutes,
+    )
+    return json_response(dump_json(slots))
+
+
+def _series_response(series: ReservationSeries, reservations: list[ReservationResponse]) -> ReservationSeriesResponse:
+    return ReservationSeriesResponse(
+        series_id=series.series_id,
+        created_by=series.created_by,
+        title=series.title,
+        frequency=series.frequency,
+        start_date=series.start_date,
+        until_date=series.until_date,
+        exception_dates=series.exception_dates,
+        start_time=series.start_time,
+        end_time=series.end_time,
+        location=series.location,
+        room_id=series.room_id,
+        description=series.description,
+        max_participants=series.max_participants,
+        created_at=series.created_at,
+        updated_at=series.updated_at,
+        reservations=reservations,
+    )
+
+
+async def _get_series_for_update(db: AsyncSession, series_id: int, current_user: User, action: str) -> ReservationSeries:
+    """반복 예약 규칙을 잠그고 가져온다 (생성자 또는 admin/root만 가능)"""
+    result = await db.execute(
+        select(ReservationSeries).where(ReservationSeries.series_id == series_id).with_for_update()
+    )
+    series = result.scalar_one_or_none()
+
+    if series is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="반복 예약을 찾을 수 없습니다")
+
+    if series.created_by != current_user.user_id and current_user.role not in ("admin", "root"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"{action} 권한이 없습니다")
+
+    return series
+
+
+@router.post("/series", response_model=ReservationSeriesResponse, status_code=status.HTTP_201_CREATED)
+async def create_reservation_series(
+    data: ReservationSeriesCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    반복 예약 생성 (매주/격주, 종료일, 제외 날짜)
+    규칙을 저장한 뒤 모든 회차를 multi-row INSERT 한 문장으로 만든다.
+    """
+    dates = occurrence_dates(data.start_date, data.until_date, data.frequency, data.exception_dates)
+
+    series = ReservationSeries(created_by=current_user.user_id, **data.model_dump())
+    db.add(series)
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+
+    occurrence = {
+        "created_by": current_user.user_id,
+        "title": data.title,
+        "start_time": data.start_time,
+        "end_time": data.end_time,
+        "location": data.location,
+        "room_id": data.room_id,
+        "description": data.description,
+        "max_participants": data.max_participants,
+        "series_id": series.series_id,
+    }
+    try:
+        # 한 회차라도 합주실 시간이 겹치면 전체가 409로 실패한다
+        result = await db.execute(
+            insert(Reservation)
+            .values([{**occurrence, "reservation_date": day} for day in dates])
+            .returning(*Reservation.__table__.columns)
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    rows = result.all()
+    await db.commit()
+    invalidate_months(*dates)
+    await db.refresh(series)
+
+    reservations = [
+        ReservationResponse(**row._mapping, creator_nickname=current_user.nickname)
+        for row in sorted(rows, key=lambda row: row.reservation_date)
+    ]
+    publish(
+        *(
+            reservation_event("created", r.reservation_id, r.reservation_date, reservation=r.model_dump())
+            for r in reservations
+        )
+    )
+    return _series_response(series, reservations)
+
+
+@router.get("/series/{series_id}", response_model=ReservationSeriesResponse)
+async def get_reservation_series(
+    series_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """반복 예약 조회 (남아 있는 회차 포함)"""
+    series = await db.get(ReservationSeries, series_id)
+    if series is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="반복 예약을 찾을 수 없습니다")
+
+    result = await db.execute(
+        select(*RESERVATION_LIST_COLUMNS)
+        .select_from(Reservation)
+        .join(User, Reservation.created_by == User.user_id)
+        .where(Reservation.series_id == series_id)
+        .order_by(Reservation.reservation_date, Reservation.start_time)
+    )
+    reservations = [ReservationResponse(**row._mapping) for row in result.all()]
+    return _series_response(series, reservations)
+
+
+@router.put("/series/{series_id}")
+async def update_reservation_series(
+    series_id: int,
+    data: ReservationSeriesUpdate,
+    from_date: date | None = Query(None, description="이 날짜 이후 회차만 수정 (기본: 전체)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    반복 예약 수정 — 전체 또는 "이 회차와 이후 회차" (생성자 또는 admin/root만 가능)
+    from_date가 시작일 이후면 규칙을 둘로 나눠 from_date부터는 새 규칙에 연결한다.
+    회차 변경은 UPDATE 한 문장으로 처리한다.
+    """
+    series = await _get_series_for_update(db, series_id, current_user, "수정")
+
+    update_data = data.model_dump(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 항목이 없습니다")
+    # status는 회차별 값이라 규칙에는 저장하지 않는다
+    template_data = {field: value for field, value in update_data.items() if field != "status"}
+
+    targets = [Reservation.series_id == series_id]
+    if from_date is not None and from_date > series.start_date:
+        if from_date > series.until_date:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 회차가 없습니다")
+        targets.append(Reservation.reservation_date >= from_date)
+        # from_date 이후를 새 규칙으로 분리하고 기존 규칙은 그 전날까지로 줄인다
+        target_series = ReservationSeries(
+            created_by=series.created_by,
+            title=series.title,
+            frequency=series.frequency,
+            start_date=from_date,
+            until_date=series.until_date,
+            exception_dates=[day for day in series.exception_dates if day >= from_date],
+            start_time=series.start_time,
+            end_time=series.end_time,
+            location=series.location,
+            room_id=series.room_id,
+            description=series.description,
+            max_participants=series.max_participants,
+        )
+        db.add(target_series)
+        series.until_date = from_date - timedelta(days=1)
+        series.exception_dates = [day for day in series.exception_dates if day < from_date]
+    else:
+        target_series = series
+
+    for field, value in template_data.items():
+        setattr(target_series, field, value)
+
+    try:
+        await db.flush()
+        result = await db.execute(
+            update(Reservation)
+            .where(*targets)
+            .values(**update_data, series_id=target_series.series_id)
+            .returning(Reservation.reservation_id, Reservation.reservation_date, Reservation.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    rows = result.all()
+    dates = [row.reservation_date for row in rows]
+    await db.commit()
+    invalidate_months(*dates)
+    changes = {**update_data, "series_id": target_series.series_id}
+    publish(
+        *(
+            reservation_event(
+                "updated", row.reservation_id, row.reservation_date, changes={**changes, "updated_at": row.updated_at}
+            )
+            for row in rows
+        )
+    )
+
+    return {
+        "message": f"반복 예약 {len(dates)}건이 수정되었습니다",
+        "series_id": target_series.series_id,
+        "updated_count": len(dates),
+    }
+
+
+@router.delete("/series/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_reservation_series(
+    series_id: int,
+    from_date: date | None = Query(None, description="이 날짜 이후 회차만 삭제 (기본: 전체)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    반복 예약 삭제 — 전체 또는 "이 회차와 이후 회차" (생성자 또는 admin/root만 가능)
+    참가자와 회차를 DELETE 문 하나씩으로 지우고, 일부만 지운 경우 규칙의 종료일을 줄인다.
+    """
+    series = await _get_series_for_update(db, series_id, current_user, "삭제")
+
+    targets = [Reservation.series_id == series_id]
+    partial = from_date is not None and from_date > series.start_date
+    if partial:
+        targets.append(Reservation.reservation_date >= from_date)
+
+    await db.execute(
+        delete(ReservationParticipant)
+        .where(ReservationParticipant.reservation_id.in_(select(Reservation.reservation_id).where(*targets)))
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(
+        delete(Reservation)
+        .where(*targets)
+        .returning(Reservation.reservation_id, Reservation.reservation_date)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.all()
+    dates = [row.reservation_date for row in deleted]
+
+    if partial:
+        series.until_date = min(series.until_date, from_date - timedelta(days=1))
+        series.exception_dates = [day for day in series.exception_dates if day < from_date]
+    else:
+        await db.execute(delete(ReservationSeries).where(ReservationSeries.series_id == series_id))
+    await db.commit()
+    invalidate_months(*dates)
+    publish(*(reservation_event("deleted", row.reservation_id, row.reservation_date) for row in deleted))
 
 
 @router.get("/{reservation_id}", response_model=ReservationDetailResponse)
@@ -126,19 +521,19 @@ async def get_reservation(
     current_user: User = Depends(get_current_user),
 ):
     """예약 상세 조회 (참가자 목록 포함)"""
+    # 생성자 닉네임은 조인으로, 참가자는 유저와 조인해 쿼리 하나로 가져온다 (예약 + 참가자 = 2개)
     result = await db.execute(
-        select(Reservation)
-        .options(selectinload(Reservation.participants).selectinload(ReservationParticipant.user))
+        select(Reservation, User.nickname)
+        .join(User, Reservation.created_by == User.user_id)
+        .options(selectinload(Reservation.participants).joinedload(ReservationParticipant.user))
         .where(Reservation.reservation_id == reservation_id)
     )
-    reservation = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if reservation is None:
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다")
 
-    # 생성자 닉네임
-    creator_result = await db.execute(select(User.nickname).where(User.user_id == reservation.created_by))
-    creator_nickname = creator_result.scalar_one_or_none()
+    reservation, creator_nickname = row
 
     confirmed_participants = [p for p in reservation.participants if p.status == "confirmed"]
 
@@ -151,10 +546,12 @@ async def get_reservation(
         start_time=reservation.start_time,
         end_time=reservation.end_time,
         location=reservation.location,
+        room_id=reservation.room_id,
         description=reservation.description,
         status=reservation.status,
         max_participants=reservation.max_participants,
         participant_count=len(confirmed_participants),
+        series_id=reservation.series_id,
         created_at=reservation.created_at,
         updated_at=reservation.updated_at,
         participants=[
@@ -189,21 +586,28 @@ async def update_reservation(
     if reservation.created_by != current_user.user_id and current_user.role not in ("admin", "root"):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="수정 권한이 없습니다")
 
+    previous_date = reservation.reservation_date
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(reservation, field, value)
 
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    invalidate_months(previous_date, reservation.reservation_date)
     await db.refresh(reservation)
-
-    # 참가자 수 조회
-    count_result = await db.execute(
-        select(func.count()).where(
-            ReservationParticipant.reservation_id == reservation_id,
-            ReservationParticipant.status == "confirmed",
+    publish(
+        reservation_event(
+            "updated",
+            reservation.reservation_id,
+            previous_date,
+            reservation.reservation_date,
+            changes={**update_data, "updated_at": reservation.updated_at},
         )
     )
-    participant_count = count_result.scalar()
 
     return ReservationResponse(
         reservation_id=reservation.reservation_id,
@@ -214,10 +618,12 @@ async def update_reservation(
         start_time=reservation.start_time,
         end_time=reservation.end_time,
         location=reservation.location,
+        room_id=reservation.room_id,
         description=reservation.description,
         status=reservation.status,
         max_participants=reservation.max_participants,
-        participant_count=participant_count or 0,
+        participant_count=reservation.participant_count,
+        series_id=reservation.series_id,
         created_at=reservation.created_at,
         updated_at=reservation.updated_at,
     )
@@ -243,6 +649,8 @@ async def delete_reservation(
 
     await db.delete(reservation)
     await db.commit()
+    invalidate_months(reservation.reservation_date)
+    publish(reservation_event("deleted", reservation_id, reservation.reservation_date))
 
 
 @router.post("/{reservation_id}/participate", status_code=status.HTTP_201_CREATED)
@@ -251,47 +659,79 @@ async def participate_reservation(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """예약 참가 신청"""
-    # 예약 존재 확인
+    """
+    예약 참가 신청
+    열려 있고 정원이 남은 예약에만 참가자를 추가하고 participant_count를 올리는 작업을
+    한 문장으로 처리한다. 예약 행을 FOR UPDATE로 잠그므로 동시 신청이 몰려도 정원을 넘지 않는다.
+    """
+    user_id = current_user.user_id
+    target = (
+        select(Reservation.reservation_id)
+        .where(
+            Reservation.reservation_id == reservation_id,
+            Reservation.status == "open",
+            or_(
+                Reservation.max_participants.is_(None),
+                Reservation.participant_count < Reservation.max_participants,
+            ),
+        )
+        .with_for_update()
+        .cte("target")
+    )
+    inserted = (
+        pg_insert(ReservationParticipant)
+        .from_select(
+            ["reservation_id", "user_id"],
+            select(target.c.reservation_id, literal(user_id, BigInteger)),
+        )
+        .on_conflict_do_nothing(index_elements=["reservation_id", "user_id"])
+        .returning(ReservationParticipant.reservation_id)
+        .cte("inserted")
+    )
     result = await db.execute(
-        select(Reservation).where(Reservation.reservation_id == reservation_id)
+        update(Reservation)
+        .where(Reservation.reservation_id == inserted.c.reservation_id)
+        .values(participant_count=Reservation.participant_count + 1)
+        .returning(Reservation.reservation_date, Reservation.participant_count)
+        .execution_options(synchronize_session=False)
     )
-    reservation = result.scalar_one_or_none()
+    joined = result.one_or_none()
+
+    if joined is None:
+        # 실패한 경우에만 원인을 조회한다
+        await db.rollback()
+        result = await db.execute(
+            select(
+                Reservation.status,
+                Reservation.max_participants,
+                Reservation.participant_count,
+                select(ReservationParticipant.participant_id)
+                .where(
+                    ReservationParticipant.reservation_id == reservation_id,
+                    ReservationParticipant.user_id == user_id,
+                )
+                .exists(),
+            ).where(Reservation.reservation_id == reservation_id)
+        )
+        row = result.one_or_none()
 
-    if reservation is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다")
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약을 찾을 수 없습니다")
 
-    if reservation.status != "open":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="참가 신청이 마감된 예약입니다")
+        reservation_status, max_participants, participant_count, already_joined = row
+        if reservation_status != "open":
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="참가 신청이 마감된 예약입니다")
+        if already_joined:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 참가 신청한 예약입니다")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="참가 정원이 초과되었습니다")
 
-    # 이미 참가 중인지 확인
-    existing = await db.execute(
-        select(ReservationParticipant).where(
-            ReservationParticipant.reservation_id == reservation_id,
-            ReservationParticipant.user_id == current_user.user_id,
-        )
-    )
-    if existing.scalar_one_or_none() is not None:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 참가 신청한 예약입니다")
-
-    # 정원 확인
-    if reservation.max_participants is not None:
-        count_result = await db.execute(
-            select(func.count()).where(
-                ReservationParticipant.reservation_id == reservation_id,
-                ReservationParticipant.status == "confirmed",
-            )
+    await db.commit()
+    invalidate_months(joined.reservation_date)
+    publish(
+        reservation_event(
+            "participants", reservation_id, joined.reservation_date, delta=1, participant_count=joined.participant_count
         )
-        current_count = count_result.scalar()
-        if current_count >= reservation.max_participants:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="참가 정원이 초과되었습니다")
-
-    participant = ReservationParticipant(
-        reservation_id=reservation_id,
-        user_id=current_user.user_id,
     )
-    db.add(participant)
-    await db.commit()
 
     return {"message": "참가 신청이 완료되었습니다"}
 
@@ -302,17 +742,56 @@ async def cancel_participation(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """예약 참가 취소"""
-    result = await db.execute(
-        select(ReservationParticipant).where(
-            ReservationParticipant.reservation_id == reservation_id,
+    """
+    예약 참가 취소
+    참가 행 삭제와 participant_count 감소를 한 문장으로 처리한다. 실제로 삭제된 confirmed 행이 있을 때만 줄이므로
+    같은 취소 요청이 동시에 여러 번 와도 한 번만 줄어든다. (나머지는 삭제된 행이 없어 404)
+    참가 신청과 같은 순서(예약 행 → 참가 행)로 잠가, 같은 유저의 신청/취소가 겹쳐도 교착 상태가 생기지 않는다.
+    """
+    target = (
+        select(Reservation.reservation_id)
+        .where(Reservation.reservation_id == reservation_id)
+        .with_for_update()
+        .cte("target")
+    )
+    deleted = (
+        delete(ReservationParticipant)
+        .where(
+            ReservationParticipant.reservation_id.in_(select(target.c.reservation_id)),
             ReservationParticipant.user_id == current_user.user_id,
         )
+        .returning(ReservationParticipant.status)
+        .cte("deleted")
+    )
+    updated = (
+        update(Reservation)
+        .where(
+            Reservation.reservation_id == reservation_id,
+            select(deleted.c.status).where(deleted.c.status == "confirmed").exists(),
+        )
+        .values(participant_count=Reservation.participant_count - 1)
+        .returning(Reservation.reservation_date, Reservation.participant_count)
+        .cte("updated")
+    )
+    result = await db.execute(
+        select(
+            select(func.count()).select_from(deleted).scalar_subquery().label("deleted"),
+            select(updated.c.reservation_date).scalar_subquery().label("reservation_date"),
+            select(updated.c.participant_count).scalar_subquery().label("participant_count"),
+        )
     )
-    participant = result.scalar_one_or_none()
+    row = result.one()
 
-    if participant is None:
+    if row.deleted == 0:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="참가 신청 내역이 없습니다")
 
-    await db.delete(participant)
     await db.commit()
+    # confirmed가 아닌 참가 행은 목록의 참가자 수에 들어가지 않으므로 캐시/이벤트도 건드리지 않는다
+    if row.participant_count is not None:
+        invalidate_months(row.reservation_date)
+        publish(
+            reservation_event(
+                "participants", reservation_id, row.reservation_date, delta=-1, participant_count=row.participant_count
+            )
+        )
@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.room import Room
+from app.models.user import User
+from app.schemas.room import RoomCreate, RoomResponse, RoomUpdate
+from app.services.auth import get_current_user
+from app.services.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.services.rooms import raise_for_room_error
+
+router = APIRouter()
+
+# 합주실 목록은 거의 바뀌지 않는다
+ROOMS_CACHE_CONTROL = "private, max-age=300"
+
+
+def require_admin(user: User):
+    """admin 또는 root 권한 확인"""
+    if user.role not in ("admin", "root"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다")
+
+
+@router.get("/", response_model=list[RoomResponse])
+async def get_rooms(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """합주실 목록 조회 (ETag, If-None-Match 일치 시 304)"""
+    stamp = (await db.execute(select(func.count(), func.max(Room.updated_at)))).one()
+    etag = make_etag("rooms", *stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag, ROOMS_CACHE_CONTROL)
+    set_cache_headers(response, etag, ROOMS_CACHE_CONTROL)
+
+    result = await db.execute(select(Room).order_by(Room.name))
+    return result.scalars().all()
+
+
+@router.post("/", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
+async def create_room(
+    data: RoomCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """합주실 추가 (admin/root)"""
+    require_admin(current_user)
+
+    room = Room(name=data.name, description=data.description)
+    db.add(room)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    await db.refresh(room)
+    return room
+
+
+@router.put("/{room_id}", response_model=RoomResponse)
+async def update_room(
+    room_id: int,
+    data: RoomUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """합주실 수정 (admin/root)"""
+    require_admin(current_user)
+
+    room = await db.get(Room, room_id)
+    if room is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="합주실을 찾을 수 없습니다")
+
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(room, field, value)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_room_error(exc)
+        raise
+    await db.refresh(room)
+    return room
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -13,18 +14,28 @@ from app.schemas.session import (
     UserSessionUpdate,
 )
 from app.services.auth import get_current_user
+from app.services.etag import etag_matches, not_modified, set_cache_headers
+from app.services.session_catalog import get_catalog, refresh_catalog, resolve_session_names, session_name
 
 router = APIRouter()
 
+# 세션(악기) 목록은 거의 바뀌지 않는다
+SESSIONS_CACHE_CONTROL = "private, max-age=300"
+
 
 @router.get("/", response_model=list[SessionResponse])
 async def get_sessions(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """세션(악기) 목록 조회"""
-    result = await db.execute(select(Session).order_by(Session.name))
-    return result.scalars().all()
+    """세션(악기) 목록 조회 (카탈로그에서 응답, ETag, If-None-Match 일치 시 304)"""
+    catalog = await get_catalog(db)
+    if etag_matches(request, catalog.etag):
+        return not_modified(catalog.etag, SESSIONS_CACHE_CONTROL)
+    set_cache_headers(response, catalog.etag, SESSIONS_CACHE_CONTROL)
+    return catalog.sessions
 
 
 @router.post("/", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
@@ -33,18 +44,25 @@ async def create_session(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """세션(악기) 추가 (admin/root)"""
+    """세션(악기) 추가 (admin/root) — 추가 후 카탈로그를 바로 다시 읽고 다른 워커에도 알린다"""
     if current_user.role not in ("admin", "root"):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다")
 
-    existing = await db.execute(select(Session).where(Session.name == data.name))
-    if existing.scalar_one_or_none() is not None:
+    catalog = await get_catalog(db)
+    if data.name in catalog.ids:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 세션입니다")
 
     session = Session(name=data.name)
     db.add(session)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 카탈로그에 아직 없는, 다른 워커가 방금 추가한 이름
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 존재하는 세션입니다")
     await db.refresh(session)
+
+    await refresh_catalog(db)
     return session
 
 
@@ -56,25 +74,23 @@ async def get_my_sessions(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """내 세션(악기) 목록 조회"""
-    result = await db.execute(
-        select(UserSession, Session.name)
-        .join(Session, UserSession.session_id == Session.session_id)
-        .where(UserSession.user_id == current_user.user_id)
-        .order_by(UserSession.is_main.desc(), Session.name)
-    )
-    rows = result.all()
+    """내 세션(악기) 목록 조회 (세션 이름은 카탈로그에서)"""
+    result = await db.execute(select(UserSession).where(UserSession.user_id == current_user.user_id))
+    user_sessions = result.scalars().all()
+    names = await resolve_session_names(db, (us.session_id for us in user_sessions))
 
+    # 메인 세션 먼저, 그다음 세션 이름순
+    user_sessions = sorted(user_sessions, key=lambda us: (not us.is_main, names[us.session_id]))
     return [
         UserSessionResponse(
             user_session_id=us.user_session_id,
             session_id=us.session_id,
-            session_name=name,
+            session_name=names[us.session_id],
             is_main=us.is_main,
             skill_level=us.skill_level,
             created_at=us.created_at,
         )
-        for us, name in rows
+        for us in user_sessions
     ]
 
 
@@ -85,10 +101,9 @@ async def add_my_session(
     current_user: User = Depends(get_current_user),
 ):
     """내 세션(악기) 등록"""
-    # 세션 존재 확인
-    session_result = await db.execute(select(Session).where(Session.session_id == data.session_id))
-    session = session_result.scalar_one_or_none()
-    if session is None:
+    # 세션 존재 확인 (카탈로그)
+    name = await session_name(db, data.session_id)
+    if name is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="세션을 찾을 수 없습니다")
 
     # 중복 확인
@@ -125,7 +140,7 @@ async def add_my_session(
     return UserSessionResponse(
         user_session_id=user_session.user_session_id,
         session_id=user_session.session_id,
-        session_name=session.name,
+        session_name=name,
         is_main=user_session.is_main,
         skill_level=user_session.skill_level,
         created_at=user_session.created_at,
@@ -170,13 +185,10 @@ async def update_my_session(
     await db.commit()
     await db.refresh(user_session)
 
-    session_result = await db.execute(select(Session.name).where(Session.session_id == user_session.session_id))
-    session_name = session_result.scalar_one()
-
     return UserSessionResponse(
         user_session_id=user_session.user_session_id,
         session_id=user_session.session_id,
-        session_name=session_name,
+        session_name=await session_name(db, user_session.session_id),
         is_main=user_session.is_main,
         skill_level=user_session.skill_level,
         created_at=user_session.created_at,
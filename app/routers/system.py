@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.database import pool_status
+from app.models.user import User
+from app.services.auth import get_current_user
+from app.services.cache import all_cache_stats
+from app.services.invalidation import bus
+from app.services.reservation_events import broker
+
+router = APIRouter()
+
+
+def require_admin(user: User):
+    if user.role not in ("admin", "root"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다")
+
+
+@router.get("/caches")
+async def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """프로세스 내 캐시 통계 조회 (admin/root, 워커별 값)"""
+    require_admin(current_user)
+    return all_cache_stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(current_user: User = Depends(get_current_user)):
+    """DB 커넥션 풀 상태 조회 (admin/root, 워커별 값)"""
+    require_admin(current_user)
+    return pool_status()
+
+
+@router.get("/events")
+async def get_event_stream_stats(current_user: User = Depends(get_current_user)):
+    """예약 변경 스트림 구독자/발행 통계 조회 (admin/root, 워커별 값)"""
+    require_admin(current_user)
+    return broker.stats()
+
+
+@router.get("/invalidation")
+async def get_invalidation_stats(current_user: User = Depends(get_current_user)):
+    """워커 간 캐시 무효화 버스 상태 조회 (admin/root, 워커별 값)"""
+    require_admin(current_user)
+    return bus.stats()
@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
-from app.models.session import Session
 from app.models.team import Team, TeamMember
 from app.models.user import User
 from app.schemas.team import (
@@ -12,12 +12,40 @@ from app.schemas.team import (
     TeamCreate,
     TeamDetailResponse,
     TeamResponse,
+    TeamRosterUpdate,
     TeamUpdate,
 )
 from app.services.auth import get_current_user
+from app.services.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.services.serialization import dump_rows, json_response, schema_columns
+from app.services.session_catalog import resolve_session_names, session_name
 
 router = APIRouter()
 
+# 팀 구성은 자주 바뀌지 않으므로 1분간은 재검증 없이 사용
+TEAMS_CACHE_CONTROL = "private, max-age=60"
+
+_member_count_subq = (
+    select(TeamMember.team_id, func.count().label("member_count"))
+    .group_by(TeamMember.team_id)
+    .subquery()
+)
+
+# 팀 목록은 Row → JSON 바이트로 바로 직렬화한다 (TeamResponse 필드 순서)
+TEAM_LIST_COLUMNS = schema_columns(
+    TeamResponse,
+    team_id=Team.team_id,
+    name=Team.name,
+    description=Team.description,
+    member_count=func.coalesce(_member_count_subq.c.member_count, 0),
+    created_at=Team.created_at,
+)
+
+
+async def _touch_team(db: AsyncSession, team_id: int):
+    """멤버 구성이 바뀌면 팀 updated_at을 갱신해 목록 ETag가 바뀌게 한다."""
+    await db.execute(update(Team).where(Team.team_id == team_id).values(updated_at=func.now()))
+
 
 def require_admin(user: User):
     """admin 또는 root 권한 확인"""
@@ -27,33 +55,27 @@ def require_admin(user: User):
 
 @router.get("/", response_model=list[TeamResponse])
 async def get_teams(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """팀 목록 조회"""
-    member_count_subq = (
-        select(TeamMember.team_id, func.count().label("member_count"))
-        .group_by(TeamMember.team_id)
-        .subquery()
-    )
+    """팀 목록 조회 (ETag, If-None-Match 일치 시 304, 스키마: TeamResponse)"""
+    # 버전 스탬프: 팀 수 + 최종 수정 시각 (멤버 추가/삭제도 teams.updated_at을 갱신한다)
+    stamp = (await db.execute(select(func.count(), func.max(Team.updated_at)).select_from(Team))).one()
+    etag = make_etag("teams", *stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag, TEAMS_CACHE_CONTROL)
 
     result = await db.execute(
-        select(Team, member_count_subq.c.member_count)
-        .outerjoin(member_count_subq, Team.team_id == member_count_subq.c.team_id)
+        select(*TEAM_LIST_COLUMNS)
+        .select_from(Team)
+        .outerjoin(_member_count_subq, Team.team_id == _member_count_subq.c.team_id)
         .order_by(Team.created_at)
     )
-    rows = result.all()
-
-    return [
-        TeamResponse(
-            team_id=team.team_id,
-            name=team.name,
-            description=team.description,
-            member_count=count or 0,
-            created_at=team.created_at,
-        )
-        for team, count in rows
-    ]
+
+    response = json_response(dump_rows(result.all()))
+    set_cache_headers(response, etag, TEAMS_CACHE_CONTROL)
+    return response
 
 
 @router.post("/", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
@@ -90,7 +112,6 @@ async def get_team(
         select(Team)
         .options(
             selectinload(Team.members).selectinload(TeamMember.user),
-            selectinload(Team.members).selectinload(TeamMember.session),
         )
         .where(Team.team_id == team_id)
     )
@@ -99,6 +120,9 @@ async def get_team(
     if team is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다")
 
+    # 세션 이름은 카탈로그에서 (sessions 조회 생략)
+    session_names = await resolve_session_names(db, (m.session_id for m in team.members))
+
     return TeamDetailResponse(
         team_id=team.team_id,
         name=team.name,
@@ -110,7 +134,7 @@ async def get_team(
                 "user_id": m.user.user_id,
                 "nickname": m.user.nickname,
                 "kakao_profile_image_url": m.user.kakao_profile_image_url,
-                "session_name": m.session.name,
+                "session_name": session_names[m.session_id],
                 "joined_at": m.joined_at,
             }
             for m in team.members
@@ -164,35 +188,127 @@ async def add_team_member(
     """팀 멤버 추가 (root/admin)"""
     require_admin(current_user)
 
-    # 팀 존재 확인
-    team = await db.execute(select(Team).where(Team.team_id == team_id))
-    if team.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다")
+    # 팀/유저 존재 여부와 중복 가입 여부를 한 번에 확인 (세션은 카탈로그로 확인)
+    checks = (
+        await db.execute(
+            select(
+                select(Team.team_id).where(Team.team_id == team_id).exists().label("team"),
+                select(User.user_id).where(User.user_id == data.user_id).exists().label("user"),
+                select(TeamMember.team_member_id)
+                .where(TeamMember.team_id == team_id, TeamMember.user_id == data.user_id)
+                .exists()
+                .label("member"),
+            )
+        )
+    ).one()
 
-    # 유저 존재 확인
-    user = await db.execute(select(User).where(User.user_id == data.user_id))
-    if user.scalar_one_or_none() is None:
+    if not checks.team:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다")
+    if not checks.user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="유저를 찾을 수 없습니다")
-
-    # 세션 존재 확인
-    session = await db.execute(select(Session).where(Session.session_id == data.session_id))
-    if session.scalar_one_or_none() is None:
+    if await session_name(db, data.session_id) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="세션을 찾을 수 없습니다")
-
-    # 중복 확인
-    existing = await db.execute(
-        select(TeamMember).where(TeamMember.team_id == team_id, TeamMember.user_id == data.user_id)
-    )
-    if existing.scalar_one_or_none() is not None:
+    if checks.member:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이미 팀에 소속된 멤버입니다")
 
-    member = TeamMember(team_id=team_id, user_id=data.user_id, session_id=data.session_id)
-    db.add(member)
+    # 멤버 추가와 팀 updated_at 갱신(_touch_team)을 한 문장으로
+    inserted = (
+        insert(TeamMember)
+        .values(team_id=team_id, user_id=data.user_id, session_id=data.session_id)
+        .returning(TeamMember.team_id)
+        .cte("inserted")
+    )
+    await db.execute(
+        update(Team)
+        .where(Team.team_id.in_(select(inserted.c.team_id)))
+        .values(updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
 
     return {"message": "멤버가 추가되었습니다"}
 
 
+@router.put("/{team_id}/members")
+async def replace_team_members(
+    team_id: int,
+    data: TeamRosterUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    팀 멤버 구성 일괄 반영 (root/admin)
+    원하는 전체 멤버 목록을 받아 현재 구성과의 차이만 한 트랜잭션으로 적용한다.
+    - 검증: 요청한 유저 존재 여부를 쿼리 한 번으로, 세션은 카탈로그로 확인
+    - 제거: 목록에 없는 멤버를 DELETE 한 문장으로
+    - 추가/세션 변경: INSERT ... ON CONFLICT DO UPDATE 한 문장으로 (기존 멤버의 가입일은 유지)
+    """
+    require_admin(current_user)
+
+    roster = {member.user_id: member.session_id for member in data.members}
+    if len(roster) != len(data.members):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="같은 유저가 두 번 이상 포함되어 있습니다")
+
+    # 팀 행을 잠가 같은 팀의 구성 변경이 동시에 들어와도 차례로 반영되게 한다
+    locked = await db.execute(select(Team.team_id).where(Team.team_id == team_id).with_for_update())
+    if locked.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="팀을 찾을 수 없습니다")
+
+    if roster:
+        found = await db.execute(select(User.user_id).where(User.user_id.in_(list(roster))))
+        missing_users = sorted(roster.keys() - set(found.scalars().all()))
+        if missing_users:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"유저를 찾을 수 없습니다 (user_id: {', '.join(map(str, missing_users))})",
+            )
+        missing_sessions = sorted(set(roster.values()) - (await resolve_session_names(db, roster.values())).keys())
+        if missing_sessions:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"세션을 찾을 수 없습니다 (session_id: {', '.join(map(str, missing_sessions))})",
+            )
+
+    result = await db.execute(
+        delete(TeamMember)
+        .where(TeamMember.team_id == team_id, TeamMember.user_id.not_in(list(roster)))
+        .returning(TeamMember.user_id)
+        .execution_options(synchronize_session=False)
+    )
+    removed = sorted(result.scalars().all())
+
+    added, updated = [], []
+    if roster:
+        stmt = pg_insert(TeamMember).values(
+            [{"team_id": team_id, "user_id": user_id, "session_id": session_id} for user_id, session_id in roster.items()]
+        )
+        result = await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["team_id", "user_id"],
+                set_={"session_id": stmt.excluded.session_id},
+                # 세션이 그대로인 기존 멤버는 건드리지 않는다 (RETURNING에도 나오지 않음)
+                where=TeamMember.session_id != stmt.excluded.session_id,
+            ).returning(
+                TeamMember.user_id,
+                # 이번 트랜잭션에서 새로 가입한 행만 joined_at이 now()와 같다
+                (TeamMember.joined_at == func.now()).label("inserted"),
+            )
+        )
+        for user_id, inserted in result:
+            (added if inserted else updated).append(user_id)
+
+    if added or updated or removed:
+        await _touch_team(db, team_id)
+    await db.commit()
+
+    return {
+        "message": "팀 멤버 구성이 반영되었습니다",
+        "added": sorted(added),
+        "updated": sorted(updated),
+        "removed": removed,
+    }
+
+
 @router.delete("/{team_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_team_member(
     team_id: int,
@@ -212,4 +328,5 @@ async def remove_team_member(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해당 팀 멤버를 찾을 수 없습니다")
 
     await db.delete(member)
+    await _touch_team(db, team_id)
     await db.commit()
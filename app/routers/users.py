@@ -1,24 +1,72 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserResponse
 from app.schemas.user import UserListResponse, UserProfileUpdate, UserRoleUpdate
-from app.services.auth import get_current_user
+from app.services.auth import get_current_user, invalidate_principal
+from app.services.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.services.reservation_cache import clear_months
+from app.services.search import contains_pattern
+
+ROLES = ("root", "admin", "member")
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[UserListResponse])
 async def get_users(
+    response: Response,
+    q: str | None = Query(None, min_length=1, max_length=100, description="닉네임/소속 부분 검색"),
+    role: list[str] | None = Query(None, description="역할 필터 (여러 개 지정 가능)"),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    size: int = Query(50, ge=1, le=200),
+    all_: bool = Query(False, alias="all", description="true면 페이지네이션 없이 전체 반환 (admin/root 내보내기용)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """전체 멤버 목록 조회"""
-    result = await db.execute(select(User).order_by(User.nickname))
-    return result.scalars().all()
+    """
+    멤버 목록 조회 (닉네임순)
+    (nickname, user_id) 기준 커서 페이지네이션. 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려준다.
+    all=true(페이지네이션 없는 전체 목록)는 내보내기용이라 admin/root만 쓸 수 있다.
+    """
+    if all_ and current_user.role not in ("admin", "root"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다")
+
+    query = select(User).order_by(User.nickname, User.user_id)
+
+    if q is not None:
+        pattern = contains_pattern(q)
+        query = query.where(
+            or_(
+                User.nickname.ilike(pattern, escape="\\"),
+                User.affiliation.ilike(pattern, escape="\\"),
+            )
+        )
+
+    if role:
+        if any(r not in ROLES for r in role):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 역할입니다")
+        query = query.where(User.role.in_(role))
+
+    if all_:
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    if cursor is not None:
+        nickname, user_id = decode_cursor(cursor, str, int)
+        query = query.where(tuple_(User.nickname, User.user_id) > (nickname, user_id))
+
+    result = await db.execute(query.limit(size + 1))
+    users = result.scalars().all()
+
+    if len(users) > size:
+        users = users[:size]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(users[-1].nickname, users[-1].user_id)
+
+    return users
 
 
 @router.put("/me", response_model=UserResponse)
@@ -33,6 +81,10 @@ async def update_my_profile(
         setattr(current_user, field, value)
 
     await db.commit()
+    invalidate_principal(current_user.user_id)
+    if "nickname" in update_data:
+        # 월별 예약 목록에 생성자 닉네임이 들어가 있으므로 함께 비운다
+        clear_months()
     await db.refresh(current_user)
     return current_user
 
@@ -48,7 +100,7 @@ async def update_user_role(
     if current_user.role != "root":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="root 권한이 필요합니다")
 
-    if data.role not in ("root", "admin", "member"):
+    if data.role not in ROLES:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 역할입니다")
 
     result = await db.execute(select(User).where(User.user_id == user_id))
@@ -59,5 +111,6 @@ async def update_user_role(
 
     user.role = data.role
     await db.commit()
+    invalidate_principal(user.user_id)
     await db.refresh(user)
     return user
@@ -23,3 +23,28 @@ class NoticeResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class NoticeListItem(BaseModel):
+    """공지 목록 항목 (본문 대신 앞부분 발췌, 전체 본문은 상세 조회)"""
+
+    notice_id: int
+    author_id: int
+    author_nickname: str | None = None
+    title: str
+    excerpt: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class NoticeSearchResult(BaseModel):
+    notice_id: int
+    author_id: int
+    author_nickname: str | None = None
+    title: str
+    # 검색어를 <mark>로 감싼 HTML (나머지는 이스케이프됨)
+    title_highlight: str
+    snippet: str
+    rank: float
+    created_at: datetime
+    updated_at: datetime
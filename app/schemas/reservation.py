@@ -1,4 +1,5 @@
 from datetime import date, datetime, time
+from typing import Literal
 
 from pydantic import BaseModel
 
@@ -9,6 +10,7 @@ class ReservationCreate(BaseModel):
     start_time: time
     end_time: time
     location: str | None = None
+    room_id: int | None = None
     description: str | None = None
     max_participants: int | None = None
 
@@ -19,6 +21,7 @@ class ReservationUpdate(BaseModel):
     start_time: time | None = None
     end_time: time | None = None
     location: str | None = None
+    room_id: int | None = None
     description: str | None = None
     status: str | None = None
     max_participants: int | None = None
@@ -43,10 +46,12 @@ class ReservationResponse(BaseModel):
     start_time: time
     end_time: time
     location: str | None
+    room_id: int | None = None
     description: str | None
     status: str
     max_participants: int | None
     participant_count: int = 0
+    series_id: int | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -55,3 +60,65 @@ class ReservationResponse(BaseModel):
 
 class ReservationDetailResponse(ReservationResponse):
     participants: list[ParticipantResponse] = []
+
+
+class AvailabilitySlot(BaseModel):
+    """합주실 빈 시간대"""
+    room_id: int
+    reservation_date: date
+    start_time: time
+    end_time: time
+    minutes: int
+
+
+class StreamTokenResponse(BaseModel):
+    """실시간 스트림 연결용 단기 토큰"""
+    token: str
+    expires_in: int  # 초
+
+
+class ReservationSeriesCreate(BaseModel):
+    title: str
+    frequency: Literal["weekly", "biweekly"]
+    start_date: date
+    until_date: date
+    exception_dates: list[date] = []
+    start_time: time
+    end_time: time
+    location: str | None = None
+    room_id: int | None = None
+    description: str | None = None
+    max_participants: int | None = None
+
+
+class ReservationSeriesUpdate(BaseModel):
+    """이후 회차 일괄 수정 — 날짜는 그대로 두고 시간/내용만 바꾼다"""
+    title: str | None = None
+    start_time: time | None = None
+    end_time: time | None = None
+    location: str | None = None
+    room_id: int | None = None
+    description: str | None = None
+    status: str | None = None
+    max_participants: int | None = None
+
+
+class ReservationSeriesResponse(BaseModel):
+    series_id: int
+    created_by: int
+    title: str
+    frequency: str
+    start_date: date
+    until_date: date
+    exception_dates: list[date]
+    start_time: time
+    end_time: time
+    location: str | None
+    room_id: int | None = None
+    description: str | None
+    max_participants: int | None
+    created_at: datetime
+    updated_at: datetime
+    reservations: list[ReservationResponse] = []
+
+    model_config = {"from_attributes": True}
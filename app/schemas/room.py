@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class RoomCreate(BaseModel):
+    name: str
+    description: str | None = None
+
+
+class RoomUpdate(BaseModel):
+    name: str | None = None
+    description: str | None = None
+
+
+class RoomResponse(BaseModel):
+    room_id: int
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -18,6 +18,11 @@ class AddTeamMember(BaseModel):
     session_id: int
 
 
+class TeamRosterUpdate(BaseModel):
+    """팀의 전체 멤버 구성 — 목록에 없는 멤버는 제거, 새 멤버는 추가, 세션이 바뀐 멤버는 수정"""
+    members: list[AddTeamMember]
+
+
 class TeamMemberResponse(BaseModel):
     user_id: int
     nickname: str
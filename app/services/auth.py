@@ -1,14 +1,46 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
-from app.services.jwt import verify_access_token
+from app.services.cache import TTLCache
+from app.services.invalidation import bus
+from app.services.jwt import create_access_token, verify_access_token
+from app.services.kakao import get_kakao_access_token, get_kakao_user_info
 
 security = HTTPBearer()
 
+# user_id → User 컬럼 값 스냅샷
+principal_cache = TTLCache(
+    "principals",
+    maxsize=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+
+_USER_COLUMNS = [column.key for column in User.__table__.columns]
+
+
+def invalidate_principal(user_id: int) -> None:
+    """유저 정보(프로필, 역할)가 바뀌면 호출해 캐시된 인증 정보를 버린다. (다른 워커에도 알림)"""
+    principal_cache.invalidate(user_id)
+    bus.publish("principals", [user_id])
+
+
+def _on_principals_invalidated(user_ids: list | None) -> None:
+    if user_ids is None:
+        principal_cache.clear()
+        return
+    for user_id in user_ids:
+        principal_cache.invalidate(user_id)
+
+
+bus.register("principals", _on_principals_invalidated)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -19,9 +51,73 @@ async def get_current_user(
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다")
 
+    snapshot = principal_cache.get(user_id)
+    if snapshot is not None:
+        # 캐시 적중 시 쿼리 없이 세션에 붙여서 핸들러가 그대로 수정/커밋할 수 있게 한다
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    generation = principal_cache.generation
     result = await db.execute(select(User).where(User.user_id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="존재하지 않는 유저입니다")
 
+    principal_cache.set(user_id, {key: getattr(user, key) for key in _USER_COLUMNS}, generation=generation)
     return user
+
+
+async def upsert_kakao_user(db: AsyncSession, kakao_user: dict) -> int:
+    """
+    카카오 유저를 한 문장으로 생성/갱신하고 user_id를 반환한다.
+    닉네임은 가입 후 앱에서 수정할 수 있으므로 최초 가입 때만 카카오 값을 쓰고,
+    프로필 사진만 로그인할 때마다 카카오 값으로 갱신한다.
+    """
+    stmt = pg_insert(User).values(
+        kakao_id=kakao_user["kakao_id"],
+        nickname=kakao_user["nickname"],
+        kakao_profile_image_url=kakao_user.get("kakao_profile_image_url"),
+    )
+    image_changed = User.kakao_profile_image_url.is_distinct_from(stmt.excluded.kakao_profile_image_url)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.kakao_id],
+        set_={
+            "kakao_profile_image_url": stmt.excluded.kakao_profile_image_url,
+            "updated_at": case((image_changed, func.now()), else_=User.updated_at),
+        },
+    ).returning(
+        User.user_id,
+        # now()는 트랜잭션 시작 시각 → 이번에 생성됐거나 사진이 바뀐 경우에만 true
+        (User.updated_at == func.now()).label("changed"),
+    )
+
+    row = (await db.execute(stmt)).one()
+    await db.commit()
+
+    if row.changed:
+        invalidate_principal(row.user_id)
+    return row.user_id
+
+
+async def login_with_kakao(db: AsyncSession, code: str, redirect_uri: str) -> str:
+    """
+    카카오 로그인 공통 처리
+    1. 인가코드로 카카오 access_token 발급
+    2. access_token으로 유저 정보 조회
+    3. DB에 유저 생성 또는 갱신 (쿼리 1번)
+    4. JWT 발급
+    """
+    try:
+        kakao_token = await get_kakao_access_token(code, redirect_uri)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="카카오 인가코드가 유효하지 않습니다")
+
+    try:
+        kakao_user = await get_kakao_user_info(kakao_token)
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="카카오 유저 정보 조회에 실패했습니다")
+
+    user_id = await upsert_kakao_user(db, kakao_user)
+    return create_access_token(user_id)
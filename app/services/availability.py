@@ -0,0 +1,93 @@
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import date, time, timedelta
+
+from sqlalchemy import Integer, Select, func, select
+
+from app.models.reservation import Reservation
+
+
+def busy_intervals_query(start: date, end: date, room_id: int | None = None) -> Select:
+    """
+    [start, end] 기간에 합주실이 사용 중인 시간대 (room_id, 날짜, 시작 분, 종료 분)
+    예약은 하루 안에서 끝나므로 날짜 범위 조건만으로 충분하다 → (reservation_date, start_time) 인덱스 범위 스캔 한 번
+    (EXCLUDE 제약의 gist 인덱스로 tsrange 겹침을 찾을 수도 있지만, 행마다 tsrange를 다시 계산해 더 느리다)
+    시각은 자정부터의 분으로 받는다 (시작은 내림, 종료는 올림) → Python에서 time 객체를 다루지 않는다.
+    """
+    conditions = [
+        Reservation.reservation_date >= start,
+        Reservation.reservation_date <= end,
+        Reservation.room_id.is_not(None),
+        Reservation.status != "cancelled",
+    ]
+    if room_id is not None:
+        conditions.append(Reservation.room_id == room_id)
+    return (
+        select(
+            Reservation.room_id,
+            Reservation.reservation_date,
+            func.floor(func.extract("epoch", Reservation.start_time) / 60).cast(Integer).label("start_minute"),
+            func.ceil(func.extract("epoch", Reservation.end_time) / 60).cast(Integer).label("end_minute"),
+        )
+        .where(*conditions)
+        .order_by(Reservation.room_id, Reservation.reservation_date, Reservation.start_time)
+    )
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+def free_slots(
+    busy: Iterable[Sequence],
+    room_ids: Sequence[int],
+    start: date,
+    end: date,
+    day_start: time,
+    day_end: time,
+    min_minutes: int,
+) -> list[dict]:
+    """
+    합주실별/날짜별 빈 시간대를 계산한다.
+    busy는 (room_id, 날짜, 시작 분, 종료 분)을 room_id, 날짜, 시작 순으로 정렬한 목록 (busy_intervals_query 결과)
+
+    날짜마다 운영 시간 [day_start, day_end]을 시작 시각 순으로 한 번 훑으며 (정렬된 구간 sweep)
+    사용 중인 구간 사이의 빈틈 중 min_minutes 이상인 것만 남긴다. 겹치거나 운영 시간을 벗어난 구간도 처리한다.
+    결과는 날짜 → 합주실 → 시작 시각 순
+    """
+    opening, closing = _minutes(day_start), _minutes(day_end)
+    intervals: dict[tuple[int, date], list[tuple[int, int]]] = defaultdict(list)
+    for room_id, day, busy_start, busy_end in busy:
+        intervals[(room_id, day)].append((busy_start, busy_end))
+
+    slots = []
+    day = start
+    while day <= end:
+        for room_id in room_ids:
+            cursor = opening
+            for busy_start, busy_end in intervals.get((room_id, day), ()):
+                if busy_start > cursor:
+                    gap_end = min(busy_start, closing)
+                    if gap_end - cursor >= min_minutes:
+                        slots.append(_slot(room_id, day, cursor, gap_end))
+                cursor = max(cursor, busy_end)
+                if cursor >= closing:
+                    break
+            if closing - cursor >= min_minutes:
+                slots.append(_slot(room_id, day, cursor, closing))
+        day += timedelta(days=1)
+    return slots
+
+
+def _slot(room_id: int, day: date, start: int, end: int) -> dict:
+    return {
+        "room_id": room_id,
+        "reservation_date": day,
+        "start_time": _time(start),
+        "end_time": _time(end),
+        "minutes": end - start,
+    }
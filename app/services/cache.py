@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# 이름 → 캐시 인스턴스 (통계 조회, 일괄 무효화용)
+_registry: dict[str, "TTLCache"] = {}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시
+    - 항목은 ttl초 후 만료되고, maxsize를 넘으면 가장 오래 쓰지 않은 항목부터 제거한다.
+    - 무효화가 일어날 때마다 generation이 증가한다. 조회 시작 시점의 generation을
+      set()에 넘기면, 조회 도중 무효화된 경우 오래된 값이 다시 저장되지 않는다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        _registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        if generation is not None and generation != self.generation:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+def get_cache(name: str) -> TTLCache | None:
+    return _registry.get(name)
+
+
+def all_cache_stats() -> list[dict]:
+    return [cache.stats() for cache in _registry.values()]
+
+
+def clear_all_caches() -> None:
+    for cache in _registry.values():
+        cache.clear()
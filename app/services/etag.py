@@ -0,0 +1,35 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    """
+    버전 스탬프(행 수, max(updated_at) 등)로 weak ETag를 만든다.
+    응답 본문 전체를 해시하지 않으므로 304 판정에 본문이 필요 없다.
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match에 etag가 포함되어 있는지 (weak 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """304 응답 (본문 없이 검증 헤더만)"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, cache_control)
+    return response
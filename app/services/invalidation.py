@@ -0,0 +1,208 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Callable
+
+import asyncpg
+import orjson
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.services.cache import clear_all_caches
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "gaa_invalidate"
+
+# NOTIFY payload 한도는 8000바이트 → 여유를 두고 나눠 보낸다
+MAX_PAYLOAD_BYTES = 7900
+
+# 연결이 끊긴 동안 쌓아 둘 최대 메시지 수 (넘치면 전체 비우기 하나로 대체)
+MAX_PENDING = 1000
+
+# 전체 비우기 (모든 캐시 + on_reconnect 훅)
+FLUSH_ALL = "*"
+
+
+class InvalidationBus:
+    """
+    워커 간 캐시 무효화 버스 (Postgres LISTEN/NOTIFY)
+    - 쓰기 경로는 로컬 캐시를 지운 뒤 publish(kind, keys)로 다른 워커에 같은 키를 알린다.
+    - 워커마다 전용 asyncpg 커넥션 하나로 LISTEN 하고, 같은 커넥션으로 NOTIFY를 보낸다 (풀 커넥션을 쓰지 않음).
+    - 연결이 끊기면 다시 연결하고, 끊긴 동안 놓친 알림이 있을 수 있으므로 로컬 캐시를 모두 비운다.
+    메시지: {"o": 보낸 워커 id, "m": [[kind, keys], ...]} — keys가 None이면 해당 종류 전체
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex[:12]
+        self.connected = False
+        self.sent = 0
+        self.received = 0
+        self.reconnects = 0
+        self.dropped = 0
+        self._handlers: dict[str, Callable[[list | None], None]] = {}
+        self._reconnect_hooks: list[Callable[[], None]] = []
+        self._pending: list[list] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._dsn: str | None = None
+        self._stale = False
+
+    def register(self, kind: str, handler: Callable[[list | None], None]) -> None:
+        """다른 워커에서 온 kind 메시지를 처리할 함수 (keys 목록 또는 None=전체)"""
+        self._handlers[kind] = handler
+
+    def on_reconnect(self, hook: Callable[[], None]) -> None:
+        """알림을 놓쳤을 수 있을 때(재연결, 대기열 초과) 캐시 비우기와 함께 호출할 함수"""
+        self._reconnect_hooks.append(hook)
+
+    def publish(self, kind: str, keys: list | None = None) -> None:
+        """커밋 후 호출한다. 대기 없이 보낼 목록에 넣기만 한다. (버스가 꺼져 있으면 무시)"""
+        if self._task is None:
+            return
+        self._pending.append([kind, keys])
+        if len(self._pending) > MAX_PENDING:
+            self.dropped += len(self._pending)
+            self._pending = [[FLUSH_ALL, None]]
+        self._wakeup.set()
+
+    def flush_local(self) -> None:
+        clear_all_caches()
+        for hook in self._reconnect_hooks:
+            try:
+                hook()
+            except Exception:
+                logger.exception("무효화 버스 재연결 훅 실패")
+
+    async def start(self) -> None:
+        if not settings.invalidation_bus_enabled:
+            return
+        dsn = settings.invalidation_database_url or settings.database_url
+        if settings.db_pgbouncer and not settings.invalidation_database_url:
+            # transaction 모드 풀러는 LISTEN 상태를 유지하지 않는다
+            logger.warning("DB_PGBOUNCER 사용 시 INVALIDATION_DATABASE_URL(직접 연결)이 없으면 무효화 버스를 끄는다")
+            return
+        self._dsn = make_url(dsn).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                conn = await asyncpg.connect(self._dsn, timeout=10)
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as exc:
+                logger.warning("무효화 버스 연결 실패 (%.0f초 후 재시도): %s", delay, exc)
+                self._stale = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+
+            delay = 1.0
+            lost = asyncio.Event()
+
+            def on_terminate(_conn):
+                lost.set()
+                self._wakeup.set()
+
+            conn.add_termination_listener(on_terminate)
+            try:
+                await conn.add_listener(CHANNEL, self._on_notify)
+                self.connected = True
+                if self._stale:
+                    # LISTEN을 다시 건 뒤에 비워야 그 사이 알림을 놓치지 않는다
+                    self.reconnects += 1
+                    self._stale = False
+                    self.flush_local()
+                    logger.info("무효화 버스 재연결, 로컬 캐시를 비웠습니다")
+                await self._send_loop(conn, lost)
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                logger.warning("무효화 버스 연결 끊김: %s", exc)
+            finally:
+                self.connected = False
+                self._stale = True
+                conn.terminate()
+
+    async def _send_loop(self, conn: asyncpg.Connection, lost: asyncio.Event) -> None:
+        while not lost.is_set():
+            if not self._pending:
+                self._wakeup.clear()
+                try:
+                    async with asyncio.timeout(settings.invalidation_keepalive_seconds):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    # 조용히 끊긴(half-open) 연결은 알림이 안 와도 알 수 없으므로 주기적으로 확인한다
+                    await conn.execute("SELECT 1", timeout=10)
+                continue
+
+            messages, self._pending = self._pending, []
+            try:
+                payloads = self._encode(messages)
+                await conn.execute(f"SELECT pg_notify('{CHANNEL}', payload) FROM unnest($1::text[]) AS payload", payloads)
+            except BaseException:
+                # 보내지 못한 메시지는 다음 연결에서 다시 보낸다
+                self._pending[:0] = messages
+                raise
+            self.sent += len(messages)
+
+    def _encode(self, messages: list[list]) -> list[str]:
+        prefix = f'{{"o":"{self.origin}","m":['
+        payloads, chunk, size = [], [], len(prefix) + 2
+        for message in messages:
+            item = orjson.dumps(message).decode()
+            if len(prefix) + len(item.encode()) + 2 > MAX_PAYLOAD_BYTES:
+                # 한 메시지가 너무 크면 (긴 이벤트 등) 해당 종류 전체 무효화로 바꾼다
+                item = orjson.dumps([message[0], None]).decode()
+            item_size = len(item.encode()) + 1
+            if chunk and size + item_size > MAX_PAYLOAD_BYTES:
+                payloads.append(prefix + ",".join(chunk) + "]}")
+                chunk, size = [], len(prefix) + 2
+            chunk.append(item)
+            size += item_size
+        if chunk:
+            payloads.append(prefix + ",".join(chunk) + "]}")
+        return payloads
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        try:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning("무효화 버스: 잘못된 메시지 무시")
+            return
+        if data.get("o") == self.origin:
+            return
+        for kind, keys in data.get("m", []):
+            self.received += 1
+            if kind == FLUSH_ALL:
+                self.flush_local()
+                continue
+            handler = self._handlers.get(kind)
+            if handler is None:
+                continue
+            try:
+                handler(keys)
+            except Exception:
+                logger.exception("무효화 버스 처리 실패 (%s)", kind)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self._task is not None,
+            "origin": self.origin,
+            "connected": self.connected,
+            "sent": self.sent,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+        }
+
+
+bus = InvalidationBus()
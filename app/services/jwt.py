@@ -1,8 +1,24 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
 
 from app.config import settings
+from app.services.cache import TTLCache
+
+# 토큰 sha256 → (user_id, exp). 만료 시각은 조회할 때마다 다시 확인한다
+token_cache = TTLCache(
+    "verified_tokens",
+    maxsize=settings.jwt_cache_max_size,
+    ttl=settings.jwt_expire_minutes * 60,
+)
+
+# 스트림 토큰의 typ 클레임 (access token에는 typ이 없다)
+STREAM_TOKEN_TYPE = "stream"
+
+# 캐시가 어떤 서명 키로 검증된 결과인지 (키가 바뀌면 캐시를 비운다)
+_cached_signing_key: tuple[str, str] | None = None
 
 
 def create_access_token(user_id: int) -> str:
@@ -14,10 +30,67 @@ def create_access_token(user_id: int) -> str:
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
-def verify_access_token(token: str) -> int | None:
+def create_stream_token(user_id: int) -> str:
+    """
+    실시간 스트림(GET /api/reservations/stream?token=) 연결용 단기 토큰
+    쿼리 문자열은 접근 로그에 남으므로 access token 대신 이 토큰을 쓴다.
+    typ 클레임으로 구분해 일반 API 인증에는 쓸 수 없고, STREAM_TOKEN_EXPIRE_SECONDS(기본 60초) 뒤 만료된다.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(seconds=settings.stream_token_expire_seconds)
+    payload = {
+        "sub": str(user_id),
+        "exp": expire,
+        "typ": STREAM_TOKEN_TYPE,
+    }
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
+def clear_token_cache() -> None:
+    """서명 키 교체 등으로 기존 검증 결과를 모두 버린다."""
+    global _cached_signing_key
+    token_cache.clear()
+    _cached_signing_key = None
+
+
+def _decode(token: str, token_type: str | None = None) -> tuple[int, float | None] | None:
+    """서명/만료를 검증하고 (user_id, exp) 반환. typ 클레임이 token_type과 다르면 None"""
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        user_id = int(payload.get("sub"))
-        return user_id
+        if payload.get("typ") != token_type:
+            return None
+        exp = payload.get("exp")
+        return int(payload.get("sub")), float(exp) if exp is not None else None
     except (JWTError, ValueError, TypeError):
         return None
+
+
+def verify_access_token(token: str) -> int | None:
+    global _cached_signing_key
+    signing_key = (settings.jwt_secret_key, settings.jwt_algorithm)
+    if signing_key != _cached_signing_key:
+        token_cache.clear()
+        _cached_signing_key = signing_key
+
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(digest)
+    if cached is not None:
+        user_id, exp = cached
+        if time.time() < exp:
+            return user_id
+        token_cache.invalidate(digest)
+        return None
+
+    decoded = _decode(token)
+    if decoded is None:
+        return None
+    # 검증에 성공하고 만료 시각이 있는 토큰만 캐시한다 (잘못된 토큰으로 캐시를 채울 수 없도록)
+    user_id, exp = decoded
+    if exp is not None:
+        token_cache.set(digest, (user_id, exp))
+    return user_id
+
+
+def verify_stream_token(token: str) -> int | None:
+    """스트림 토큰 검증 (연결할 때 한 번만 쓰이므로 캐시하지 않는다)"""
+    decoded = _decode(token, STREAM_TOKEN_TYPE)
+    return decoded[0] if decoded is not None else None
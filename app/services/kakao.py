@@ -1,39 +1,100 @@
+import asyncio
+
 import httpx
 
 from app.config import settings
 
-KAKAO_TOKEN_URL = "https://kauth.kakao.com/oauth/token"
-KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
+KAKAO_TOKEN_URL = f"{settings.kakao_auth_base_url}/oauth/token"
+KAKAO_USER_INFO_URL = f"{settings.kakao_api_base_url}/v2/user/me"
+
+# 앱 수명 동안 공유하는 클라이언트 (keep-alive 커넥션 재사용)
+_client: httpx.AsyncClient | None = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.kakao_read_timeout, connect=settings.kakao_connect_timeout),
+        limits=httpx.Limits(
+            max_connections=settings.kakao_max_connections,
+            max_keepalive_connections=settings.kakao_max_connections,
+            keepalive_expiry=settings.kakao_keepalive_expiry,
+        ),
+        http2=settings.kakao_http2,  # true면 httpx[http2] (h2 패키지) 필요
+    )
+
+
+async def start_client() -> None:
+    """앱 시작 시(lifespan) 공유 클라이언트를 만든다."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+
+
+async def close_client() -> None:
+    """앱 종료 시(lifespan) 커넥션 풀을 닫는다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # lifespan 없이 호출된 경우(스크립트 등) 대비
+        _client = _create_client()
+    return _client
+
+
+async def _request(method: str, url: str, *, retry_on_5xx: bool, **kwargs) -> httpx.Response:
+    """
+    연결 실패는 항상, 5xx 응답은 retry_on_5xx일 때만 지수 백오프로 재시도한다.
+    인가코드는 한 번만 쓸 수 있으므로 토큰 교환은 요청이 전송되지 않은 연결 실패만 재시도한다.
+    """
+    client = get_client()
+    for attempt in range(settings.kakao_max_retries + 1):
+        last_attempt = attempt == settings.kakao_max_retries
+        try:
+            response = await client.request(method, url, **kwargs)
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            if last_attempt:
+                raise
+        else:
+            if not (retry_on_5xx and response.status_code >= 500) or last_attempt:
+                response.raise_for_status()
+                return response
+
+        await asyncio.sleep(settings.kakao_retry_backoff * 2**attempt)
 
 
 async def get_kakao_access_token(code: str, redirect_uri: str) -> str:
     """인가코드로 카카오 access_token을 받아온다."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            KAKAO_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "client_id": settings.kakao_client_id,
-                "redirect_uri": redirect_uri,
-                "code": code,
-            },
-        )
-        response.raise_for_status()
-        return response.json()["access_token"]
+    response = await _request(
+        "POST",
+        KAKAO_TOKEN_URL,
+        retry_on_5xx=False,
+        data={
+            "grant_type": "authorization_code",
+            "client_id": settings.kakao_client_id,
+            "redirect_uri": redirect_uri,
+            "code": code,
+        },
+    )
+    return response.json()["access_token"]
 
 
 async def get_kakao_user_info(access_token: str) -> dict:
     """access_token으로 카카오 유저 정보를 조회한다."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            KAKAO_USER_INFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        return {
-            "kakao_id": data["id"],
-            "nickname": data["kakao_account"]["profile"]["nickname"],
-            "kakao_profile_image_url": data["kakao_account"]["profile"].get("profile_image_url"),
-        }
+    response = await _request(
+        "GET",
+        KAKAO_USER_INFO_URL,
+        retry_on_5xx=True,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    data = response.json()
+
+    return {
+        "kakao_id": data["id"],
+        "nickname": data["kakao_account"]["profile"]["nickname"],
+        "kakao_profile_image_url": data["kakao_account"]["profile"].get("profile_image_url"),
+    }
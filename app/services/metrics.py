@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+import hmac
+import logging
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from fastapi import HTTPException, Request, status
+from starlette.responses import Response
+
+from app.config import settings
+from app.database import pool_status
+from app.services.cache import all_cache_stats
+from app.services.reservation_events import broker
+
+logger = logging.getLogger(__name__)
+
+# 여러 uvicorn 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR에 빈 디렉터리를 지정한다.
+# 워커마다 값을 파일에 쓰고, /metrics를 받은 워커가 모든 워커의 값을 합쳐 응답한다.
+# (디렉터리는 서버 시작 전에 비울 것, 지정하지 않으면 현재 프로세스 값만 노출)
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# 라우트에 매칭되지 않은 요청(404 스캔 등)은 한 라벨로 묶어 라벨 수가 늘어나지 않게 한다
+UNMATCHED_ROUTE = "unmatched"
+
+# 연결을 계속 열어 두는 응답(SSE). 지연 시간 히스토그램과 처리 중 게이지에서 빼고 연결 수는 따로 센다
+STREAMING_CONTENT_TYPE = b"text/event-stream"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS = Counter("http_requests", "HTTP 요청 수", ["method", "route", "status"])
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", ["method"], multiprocess_mode="livesum"
+)
+
+DB_POOL_SIZE = Gauge("db_pool_size", "커넥션 풀 크기 (워커 합계)", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "사용 중인 커넥션 수 (워커 합계)", multiprocess_mode="livesum")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "pool_size를 넘어 연 커넥션 수 (워커 합계)", multiprocess_mode="livesum")
+DB_POOL_CHECKOUTS = Gauge(
+    "db_pool_checkouts", "워커 시작 후 커넥션 체크아웃 횟수 (워커 합계)", multiprocess_mode="livesum"
+)
+DB_POOL_TIMEOUTS = Gauge(
+    "db_pool_checkout_timeouts", "워커 시작 후 커넥션 대기 타임아웃 횟수 (워커 합계)", multiprocess_mode="livesum"
+)
+
+CACHE_HITS = Gauge("app_cache_hits", "워커 시작 후 캐시 적중 수 (워커 합계)", ["cache"], multiprocess_mode="livesum")
+CACHE_MISSES = Gauge(
+    "app_cache_misses", "워커 시작 후 캐시 미스 수 (워커 합계)", ["cache"], multiprocess_mode="livesum"
+)
+CACHE_SIZE = Gauge("app_cache_size", "캐시 항목 수 (워커 합계)", ["cache"], multiprocess_mode="livesum")
+CACHE_HIT_RATIO = Gauge("app_cache_hit_ratio", "캐시 적중률 (워커별)", ["cache"], multiprocess_mode="liveall")
+
+EVENT_SUBSCRIBERS = Gauge(
+    "reservation_stream_subscribers", "예약 변경 스트림(SSE) 연결 수 (워커 합계)", multiprocess_mode="livesum"
+)
+
+
+def refresh_gauges() -> None:
+    """현재 워커의 커넥션 풀/캐시 상태를 게이지에 반영한다."""
+    pool = pool_status()
+    DB_POOL_SIZE.set(pool["pool_size"])
+    DB_POOL_CHECKED_OUT.set(pool["checked_out"])
+    DB_POOL_OVERFLOW.set(max(pool["overflow"], 0))
+    DB_POOL_CHECKOUTS.set(pool.get("checkouts", 0))
+    DB_POOL_TIMEOUTS.set(pool.get("timeouts", 0))
+
+    for cache in all_cache_stats():
+        CACHE_HITS.labels(cache["name"]).set(cache["hits"])
+        CACHE_MISSES.labels(cache["name"]).set(cache["misses"])
+        CACHE_SIZE.labels(cache["name"]).set(cache["size"])
+        CACHE_HIT_RATIO.labels(cache["name"]).set(cache["hit_ratio"])
+
+    EVENT_SUBSCRIBERS.set(len(broker.subscribers))
+
+
+async def refresh_gauges_periodically() -> None:
+    """
+    다른 워커가 /metrics를 받아도 이 워커의 값이 최신이도록 주기적으로 게이지를 갱신한다.
+    (lifespan에서 태스크로 실행)
+    """
+    while True:
+        try:
+            refresh_gauges()
+        except Exception:
+            logger.exception("메트릭 게이지 갱신 실패")
+        await asyncio.sleep(settings.metrics_refresh_seconds)
+
+
+@contextlib.asynccontextmanager
+async def metrics_lifespan():
+    task = asyncio.create_task(refresh_gauges_periodically())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        if MULTIPROCESS:
+            # 종료한 워커의 live* 게이지 파일 정리
+            multiprocess.mark_process_dead(os.getpid())
+
+
+def require_metrics_token(request: Request) -> None:
+    """/metrics 접근 확인: METRICS_TOKEN이 없으면 404, Bearer 토큰이 다르면 401"""
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.metrics_token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="메트릭 토큰이 올바르지 않습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def metrics_response() -> Response:
+    """Prometheus 텍스트 형식 응답"""
+    refresh_gauges()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 라우트 템플릿 기준 지연 시간 히스토그램, 상태 코드 카운터, 처리 중 요청 게이지를 기록한다.
+    스트리밍 응답(SSE)은 응답 헤더를 보낸 시점에 처리 중 게이지에서 빼고 히스토그램에도 넣지 않는다
+    (연결 시간이 지연 시간 분포와 처리 중 요청 수를 왜곡하므로). 연결 수는 reservation_stream_subscribers로 본다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        streaming = False
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+
+        async def send_wrapper(message):
+            nonlocal status_code, streaming
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                if content_type.startswith(STREAMING_CONTENT_TYPE):
+                    streaming = True
+                    in_progress.dec()
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            # 라우팅 후에는 scope["route"]가 채워진다 → "/api/reservations/{reservation_id}"
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            if not streaming:
+                in_progress.dec()
+                REQUEST_LATENCY.labels(method, route).observe(elapsed)
+            REQUESTS.labels(method, route, str(status_code)).inc()
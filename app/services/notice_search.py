@@ -0,0 +1,44 @@
+from sqlalchemy import REAL, Select, func, or_, select, tuple_
+
+from app.models.notice import Notice
+from app.models.user import User
+
+# 제목 일치를 본문 일치보다 두 배 높게 친다
+TITLE_WEIGHT = 2
+
+
+def rank_expression(query: str):
+    """검색어와의 단어 유사도 점수 (pg_trgm word_similarity, 0~3)"""
+    return (
+        func.word_similarity(query, Notice.title, type_=REAL) * TITLE_WEIGHT
+        + func.word_similarity(query, Notice.content, type_=REAL)
+    ).label("rank")
+
+
+def notice_search_query(query: str, after: tuple[float, int] | None = None) -> Select:
+    """
+    공지 검색 쿼리 (점수 내림차순, 같은 점수는 최신 공지 먼저)
+    - `컬럼 %> 검색어`(word_similarity ≥ pg_trgm.word_similarity_threshold, 기본 0.6)는
+      ix_notices_title_trgm / ix_notices_content_trgm GIN 인덱스로 후보를 찾는다 (BitmapOr).
+      ILIKE '%검색어%'는 2글자 이하 검색어에서 인덱스를 쓰지 못하고 순차 스캔으로 떨어지므로 쓰지 않는다.
+    - after: 이전 페이지 마지막 결과의 (rank, notice_id) → keyset 페이지네이션
+    """
+    rank = rank_expression(query)
+    statement = (
+        select(
+            Notice.notice_id,
+            Notice.author_id,
+            User.nickname.label("author_nickname"),
+            Notice.title,
+            Notice.content,
+            rank,
+            Notice.created_at,
+            Notice.updated_at,
+        )
+        .join(User, Notice.author_id == User.user_id)
+        .where(or_(Notice.title.op("%>")(query), Notice.content.op("%>")(query)))
+        .order_by(rank.desc(), Notice.notice_id.desc())
+    )
+    if after is not None:
+        statement = statement.where(tuple_(rank, Notice.notice_id) < after)
+    return statement
@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+
+# 다음 페이지 커서를 내려주는 응답 헤더 (본문은 기존 리스트 형태 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 인코딩한다."""
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """커서를 디코딩하고 각 값을 parsers로 변환한다. 형식이 맞지 않으면 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 커서입니다")
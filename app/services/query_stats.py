@@ -0,0 +1,136 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger("app.sql")
+
+QUERY_COUNT_HEADER = "X-DB-Queries"
+QUERY_TIME_HEADER = "X-DB-Time"
+
+
+class QueryStats:
+    """요청(또는 assert_max_queries 블록) 하나에서 실행된 SQL 문 수와 총 실행 시간"""
+
+    def __init__(self, scope: dict | None = None, parent: "QueryStats | None" = None):
+        self.scope = scope
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.statements: list[str] = []
+
+    @property
+    def route(self) -> str | None:
+        # 라우팅 후에는 scope["route"]가 채워진다 → "GET /api/reservations/{reservation_id}"
+        if self.scope is None:
+            return None
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}"
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements.append(statement)
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> QueryStats | None:
+    return _current.get()
+
+
+@contextmanager
+def collect_queries(scope: dict | None = None) -> Iterator[QueryStats]:
+    """블록 안에서 실행되는 SQL을 새 QueryStats에 모은다. (바깥 블록에도 함께 집계)"""
+    stats = QueryStats(scope=scope, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 문이 limit개를 넘으면 AssertionError (N+1 회귀 확인용)
+
+        with assert_max_queries(3):
+            await client.get(f"/api/reservations/{reservation_id}", headers=headers)
+    """
+    with collect_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        listing = "\n".join(f"  {i}. {statement}" for i, statement in enumerate(stats.statements, 1))
+        raise AssertionError(f"쿼리 {stats.count}개 실행 (최대 {limit}개)\n{listing}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+    if duration * 1000 >= settings.slow_query_ms:
+        logger.warning(
+            "slow query %.1fms [%s]: %s",
+            duration * 1000,
+            (stats.route if stats is not None else None) or "-",
+            " ".join(statement.split()),
+        )
+
+
+def _handle_error(context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각을 버린다
+    conn = context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 모든 SQL 실행을 현재 요청의 QueryStats에 기록한다. (AsyncEngine은 .sync_engine 전달)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 QueryStats를 열어 SQL 실행을 집계하는 ASGI 미들웨어
+    DEBUG 설정이 켜져 있으면 X-DB-Queries(개수), X-DB-Time(ms) 응답 헤더를 붙인다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with collect_queries(scope) as stats:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and settings.debug:
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                    headers.append((QUERY_TIME_HEADER.lower().encode(), f"{stats.duration * 1000:.2f}".encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
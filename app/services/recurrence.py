@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+
+from fastapi import HTTPException, status
+
+# 반복 주기 → 회차 간격
+FREQUENCY_STEPS = {
+    "weekly": timedelta(weeks=1),
+    "biweekly": timedelta(weeks=2),
+}
+
+# 한 번에 만들 수 있는 최대 회차 수 (매주 기준 1년 남짓)
+MAX_OCCURRENCES = 60
+
+
+def occurrence_dates(
+    start_date: date,
+    until_date: date,
+    frequency: str,
+    exception_dates: list[date] | None = None,
+) -> list[date]:
+    """
+    반복 규칙을 회차 날짜 목록으로 펼친다.
+    start_date부터 주기마다 until_date(포함)까지, exception_dates에 있는 날짜는 건너뛴다.
+    규칙이 잘못되었거나 회차가 없거나 너무 많으면 400
+    """
+    step = FREQUENCY_STEPS.get(frequency)
+    if step is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="반복 주기는 weekly 또는 biweekly만 가능합니다")
+    if until_date < start_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="반복 종료일이 시작일보다 빠릅니다")
+
+    skipped = set(exception_dates or ())
+    dates = []
+    day = start_date
+    while day <= until_date:
+        if day not in skipped:
+            dates.append(day)
+            if len(dates) > MAX_OCCURRENCES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"반복 예약은 최대 {MAX_OCCURRENCES}회까지 만들 수 있습니다",
+                )
+        day += step
+
+    if not dates:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="생성할 예약 회차가 없습니다")
+    return dates
@@ -0,0 +1,41 @@
+from datetime import date
+
+from app.config import settings
+from app.services.cache import TTLCache
+from app.services.invalidation import bus
+
+# (year, month) → (ETag, 월별 예약 목록 응답)
+month_cache = TTLCache(
+    "reservation_months",
+    maxsize=settings.month_cache_max_size,
+    ttl=settings.month_cache_ttl_seconds,
+)
+
+
+def month_key(day: date) -> tuple[int, int]:
+    return day.year, day.month
+
+
+def invalidate_months(*days: date) -> None:
+    """예약이 생성/수정/삭제되거나 참가자가 바뀐 날짜의 월 캐시를 버린다. (다른 워커에도 알림)"""
+    keys = {month_key(day) for day in days}
+    for key in keys:
+        month_cache.invalidate(key)
+    bus.publish("months", sorted(keys))
+
+
+def clear_months() -> None:
+    """모든 월 캐시를 버린다. (닉네임 변경 등, 다른 워커에도 알림)"""
+    month_cache.clear()
+    bus.publish("months")
+
+
+def _on_months_invalidated(keys: list | None) -> None:
+    if keys is None:
+        month_cache.clear()
+        return
+    for year, month in keys:
+        month_cache.invalidate((year, month))
+
+
+bus.register("months", _on_months_invalidated)
@@ -0,0 +1,182 @@
+import asyncio
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from datetime import date
+
+import orjson
+
+from app.config import settings
+from app.services.invalidation import bus
+
+# 클라이언트가 받은 마지막 이벤트 이후를 놓쳤을 때 보내는 이벤트 → 보고 있는 월을 다시 조회한다
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+def month_keys(*days: date) -> list[str]:
+    """날짜 → 월 키 ("2026-10"), 중복 제거 후 정렬"""
+    return sorted({f"{day.year:04d}-{day.month:02d}" for day in days})
+
+
+def reservation_event(op: str, reservation_id: int, *days: date, **fields) -> dict:
+    """
+    예약 변경 이벤트
+    - created: reservation (ReservationResponse 전체)
+    - updated: changes (바뀐 필드와 updated_at)
+    - deleted: 추가 필드 없음
+    - participants: delta (+1/-1), participant_count
+    months에는 영향받는 월(날짜가 바뀐 경우 이전 월 포함)이 들어간다.
+    """
+    return {"op": op, "reservation_id": reservation_id, "months": month_keys(*days), **fields}
+
+
+class Subscriber:
+    """스트림 연결 하나. 큐 길이가 제한되어 있어 연결당 메모리가 일정하다."""
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize)
+
+    def push(self, frame: bytes) -> int:
+        """프레임을 큐에 넣는다. 큐가 가득 차 버린 프레임 수를 반환"""
+        try:
+            self.queue.put_nowait(frame)
+            return 0
+        except asyncio.QueueFull:
+            # 읽는 속도가 느린 연결: 쌓인 이벤트를 버리고 resync 하나만 남긴다
+            dropped = self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_FRAME)
+            return dropped
+
+
+class EventBroker:
+    """
+    워커 내 예약 변경 이벤트 브로커 (SSE 구독자에게 전달)
+    이벤트는 발행 시 SSE 프레임 바이트로 한 번만 직렬화하고, 최근 replay_size개를 남겨
+    재연결(Last-Event-ID) 시 놓친 이벤트를 다시 보낸다. 이벤트 id는 "<워커 부팅 id>-<순번>".
+    """
+
+    def __init__(self, queue_size: int, replay_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.boot_id = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.published = 0
+        self.dropped = 0
+        self.subscribers: set[Subscriber] = set()
+        self._recent: deque[tuple[int, bytes]] = deque(maxlen=replay_size)
+
+    def publish(self, events: Iterable[dict]) -> None:
+        """커밋 후 호출한다. (대기 없이 각 구독자 큐에 넣기만 한다)"""
+        for event in events:
+            self.seq += 1
+            frame = (
+                f"id: {self.boot_id}-{self.seq}\nevent: reservation\ndata: ".encode()
+                + orjson.dumps(event)
+                + b"\n\n"
+            )
+            self._recent.append((self.seq, frame))
+            self.published += 1
+            for subscriber in self.subscribers:
+                self.dropped += subscriber.push(frame)
+
+    @property
+    def full(self) -> bool:
+        return len(self.subscribers) >= self.max_subscribers
+
+    def subscribe(self, last_event_id: str | None = None) -> Subscriber:
+        """구독자 등록. last_event_id 이후 이벤트를 먼저 넣어 둔다."""
+        subscriber = Subscriber(self.queue_size)
+        if last_event_id:
+            for frame in self._missed_since(last_event_id):
+                subscriber.push(frame)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.discard(subscriber)
+
+    def _missed_since(self, last_event_id: str) -> list[bytes]:
+        boot_id, _, seq = last_event_id.partition("-")
+        if boot_id != self.boot_id or not seq.isdigit():
+            # 다른 워커/재시작 전 이벤트 id → 놓친 이벤트를 알 수 없다
+            return [RESYNC_FRAME]
+        last_seq = int(seq)
+        if last_seq >= self.seq:
+            return []
+        if not self._recent or self._recent[0][0] > last_seq + 1:
+            # 보관 범위보다 오래 끊겨 있었다
+            return [RESYNC_FRAME]
+        return [frame for event_seq, frame in self._recent if event_seq > last_seq]
+
+    def resync(self) -> None:
+        """놓친 이벤트가 있을 수 있을 때 모든 구독자에게 resync를 보낸다."""
+        for subscriber in self.subscribers:
+            self.dropped += subscriber.push(RESYNC_FRAME)
+
+    def stats(self) -> dict:
+        return {
+            "boot_id": self.boot_id,
+            "subscribers": len(self.subscribers),
+            "max_subscribers": self.max_subscribers,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+broker = EventBroker(
+    queue_size=settings.event_queue_size,
+    replay_size=settings.event_replay_size,
+    max_subscribers=settings.event_max_subscribers,
+)
+
+
+def publish(*events: dict) -> None:
+    """이 워커의 구독자에게 보내고, 무효화 버스로 다른 워커의 구독자에게도 전달한다."""
+    broker.publish(events)
+    if events:
+        bus.publish("reservation_events", list(events))
+
+
+def _on_remote_events(events: list | None) -> None:
+    if events is None:
+        # 너무 커서 전달되지 못한 이벤트
+        broker.resync()
+    else:
+        broker.publish(events)
+
+
+bus.register("reservation_events", _on_remote_events)
+bus.on_reconnect(broker.resync)
+
+
+async def stream_frames(last_event_id: str | None = None) -> AsyncIterator[bytes]:
+    """
+    구독자를 등록하고 큐를 SSE 바이트 스트림으로 내보낸다.
+    일정 시간 이벤트가 없으면 주석 프레임(heartbeat)을 보내 프록시가 유휴 연결을 끊지 않게 한다.
+    등록은 스트림이 시작된 뒤에 하므로, 응답을 보내기 전에 끊긴 연결은 구독자로 남지 않는다.
+    연결이 끊기면(제너레이터 취소/종료) 구독을 해제한다.
+    """
+    subscriber = broker.subscribe(last_event_id)
+    try:
+        yield f"retry: {settings.event_retry_ms}\n\n".encode()
+        queue = subscriber.queue
+        while True:
+            try:
+                # wait_for와 달리 대기마다 태스크를 만들지 않는다
+                async with asyncio.timeout(settings.event_heartbeat_seconds):
+                    frame = await queue.get()
+            except TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            # 한꺼번에 쌓인 이벤트(반복 예약 등)는 한 번에 내보낸다
+            if not queue.empty():
+                frames = [frame]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                frame = b"".join(frames)
+            yield frame
+    finally:
+        broker.unsubscribe(subscriber)
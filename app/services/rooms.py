@@ -0,0 +1,38 @@
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+# 제약 이름 → 응답 (models/reservation.py, models/room.py 참고)
+ROOM_CONSTRAINT_ERRORS = {
+    # 같은 합주실 시간 겹침 (EXCLUDE USING gist, SQLSTATE 23P01)
+    "ex_reservations_room_time": (status.HTTP_409_CONFLICT, "해당 시간에 이미 예약된 합주실입니다"),
+    "ck_reservations_room_time_order": (
+        status.HTTP_400_BAD_REQUEST,
+        "합주실 예약은 종료 시간이 시작 시간보다 늦어야 합니다",
+    ),
+    "reservations_room_id_fkey": (status.HTTP_404_NOT_FOUND, "합주실을 찾을 수 없습니다"),
+    "reservation_series_room_id_fkey": (status.HTTP_404_NOT_FOUND, "합주실을 찾을 수 없습니다"),
+    "rooms_name_key": (status.HTTP_400_BAD_REQUEST, "이미 존재하는 합주실입니다"),
+}
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    """IntegrityError에서 위반된 제약 이름을 꺼낸다. (asyncpg 예외의 constraint_name)"""
+    return getattr(exc.orig.__cause__, "constraint_name", None)
+
+
+def raise_for_room_error(exc: IntegrityError) -> None:
+    """
+    합주실 관련 제약 위반이면 알맞은 HTTPException으로 바꿔 던진다. 그 외에는 아무것도 하지 않는다.
+    겹침 검사는 DB가 인덱스로 처리하므로 라우터에서 미리 조회하지 않고 커밋 실패를 변환한다.
+
+        try:
+            await db.commit()
+        except IntegrityError as exc:
+            await db.rollback()
+            raise_for_room_error(exc)
+            raise
+    """
+    error = ROOM_CONSTRAINT_ERRORS.get(violated_constraint(exc))
+    if error is not None:
+        status_code, detail = error
+        raise HTTPException(status_code=status_code, detail=detail) from exc
@@ -0,0 +1,50 @@
+import html
+import re
+
+
+def escape_like(value: str) -> str:
+    """LIKE/ILIKE 패턴에서 와일드카드(%, _)와 이스케이프 문자를 리터럴로 취급하도록 이스케이프한다."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains_pattern(value: str) -> str:
+    """부분 일치 ILIKE 패턴 (escape="\\"와 함께 사용)"""
+    return f"%{escape_like(value)}%"
+
+
+def _term_regex(query: str) -> re.Pattern | None:
+    """검색어를 공백으로 나눈 단어들 (긴 단어 우선)을 대소문자 구분 없이 찾는 정규식"""
+    terms = sorted(set(query.split()), key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile("(" + "|".join(re.escape(term) for term in terms) + ")", re.IGNORECASE)
+
+
+def highlight(text: str, query: str) -> str:
+    """
+    검색어와 일치하는 부분을 <mark>로 감싼 HTML 조각.
+    나머지 텍스트는 HTML 이스케이프하므로 클라이언트가 그대로 innerHTML로 넣어도 된다.
+    """
+    pattern = _term_regex(query)
+    if pattern is None:
+        return html.escape(text)
+    # re.split에 캡처 그룹이 있으면 홀수 번째 조각이 일치한 부분이다
+    parts = pattern.split(text)
+    return "".join(
+        f"<mark>{html.escape(part)}</mark>" if index % 2 else html.escape(part)
+        for index, part in enumerate(parts)
+    )
+
+
+def snippet(text: str, query: str, width: int = 120) -> str:
+    """
+    첫 번째 일치 위치 주변 width자 정도를 잘라 highlight한 HTML 조각.
+    (trigram 유사도로만 걸린 결과처럼 그대로 일치하는 부분이 없으면 앞부분을 쓴다)
+    """
+    pattern = _term_regex(query)
+    match = pattern.search(text) if pattern is not None else None
+    start = max(match.start() - width // 3, 0) if match else 0
+    end = min(start + width, len(text))
+    start = max(min(start, end - width), 0)
+    fragment = " ".join(text[start:end].split())
+    return ("…" if start > 0 else "") + highlight(fragment, query) + ("…" if end < len(text) else "")
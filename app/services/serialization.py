@@ -0,0 +1,38 @@
+from collections.abc import Sequence
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Row
+
+
+def schema_columns(schema: type[BaseModel], **columns: ColumnElement) -> list[ColumnElement]:
+    """
+    응답 스키마 필드 순서대로 라벨을 붙인 SELECT 컬럼 목록
+    필드와 컬럼이 하나라도 어긋나면 ValueError → 라우터 모듈 상수로 만들어 두면 import 시점에 바로 드러난다.
+    """
+    fields = list(schema.model_fields)
+    if set(fields) != set(columns):
+        raise ValueError(f"{schema.__name__} 필드와 컬럼이 다릅니다: {sorted(set(fields) ^ set(columns))}")
+    return [columns[name].label(name) for name in fields]
+
+
+def dump_rows(rows: Sequence[Row]) -> bytes:
+    """schema_columns로 조회한 Row 목록을 JSON 배열 바이트로 직렬화한다. (Pydantic 모델을 거치지 않음)"""
+    if not rows:
+        return b"[]"
+    keys = rows[0]._fields
+    return orjson.dumps([dict(zip(keys, row)) for row in rows])
+
+
+def dump_json(value) -> bytes:
+    """dict/list를 JSON 바이트로 직렬화한다. (date/time/datetime은 Pydantic과 같은 ISO 형식)"""
+    return orjson.dumps(value)
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    """
+    이미 직렬화된 JSON을 그대로 응답한다.
+    Response를 직접 반환하면 FastAPI는 response_model 검증/직렬화를 건너뛰고 OpenAPI 스키마에만 사용한다.
+    """
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.session import Session
+from app.services.cache import TTLCache
+from app.services.etag import make_etag
+from app.services.invalidation import bus
+
+# 세션(악기) 목록은 관리자가 가끔 추가만 한다 (수정/삭제 API 없음)
+# → 프로세스마다 통째로 들고 있으면서 이름 조회/존재 확인을 DB 없이 처리한다
+catalog_cache = TTLCache(
+    "session_catalog",
+    maxsize=1,
+    ttl=settings.session_catalog_ttl_seconds,
+)
+
+_CATALOG_KEY = "catalog"
+
+
+class SessionCatalog:
+    """세션 목록 스냅샷. 만든 뒤에는 바꾸지 않고, 갱신할 때 새 스냅샷으로 교체한다."""
+
+    def __init__(self, rows, started_at: float):
+        # 이름순 목록 (GET /api/sessions 응답)
+        self.sessions = [
+            {"session_id": session_id, "name": name, "created_at": created_at}
+            for session_id, name, created_at in rows
+        ]
+        self.names: dict[int, str] = {row["session_id"]: row["name"] for row in self.sessions}
+        self.ids: dict[str, int] = {name: session_id for session_id, name in self.names.items()}
+        # 세션은 추가만 가능하므로 개수 + 마지막 id로 충분하다
+        self.etag = make_etag("sessions", len(self.names), max(self.names, default=None))
+        self.started_at = started_at
+
+
+_latest: SessionCatalog | None = None
+_reload_lock = asyncio.Lock()
+
+
+async def load_catalog(db: AsyncSession) -> SessionCatalog:
+    """
+    DB에서 세션 목록을 다시 읽어 카탈로그를 교체한다. 호출한 요청의 세션(db)으로 읽는다.
+    여러 요청이 동시에 다시 읽으려 하면, 기다리는 동안 시작된 조회 결과를 함께 쓴다.
+    """
+    global _latest
+    requested_at = time.monotonic()
+    # 락을 잡기 전에 커넥션을 먼저 확보한다: 락을 쥔 채 풀을 기다리면,
+    # 커넥션을 든 채 락을 기다리는 요청들과 서로 막혀 풀이 바닥날 때 멈출 수 있다
+    await db.connection()
+    async with _reload_lock:
+        if _latest is not None and _latest.started_at >= requested_at:
+            return _latest
+
+        generation = catalog_cache.generation
+        started_at = time.monotonic()
+        rows = (
+            await db.execute(select(Session.session_id, Session.name, Session.created_at).order_by(Session.name))
+        ).all()
+
+        catalog = SessionCatalog(rows, started_at)
+        _latest = catalog
+        catalog_cache.set(_CATALOG_KEY, catalog, generation)
+        return catalog
+
+
+async def refresh_catalog(db: AsyncSession) -> SessionCatalog:
+    """세션을 추가한 뒤 호출: 이 워커는 바로 다시 읽고, 다른 워커는 캐시를 비워 다음 사용 때 다시 읽게 한다."""
+    catalog = await load_catalog(db)
+    bus.publish("session_catalog")
+    return catalog
+
+
+bus.register("session_catalog", lambda _keys: catalog_cache.clear())
+
+
+async def get_catalog(db: AsyncSession) -> SessionCatalog:
+    """캐시된 카탈로그 (없거나 TTL이 지나면 다시 읽는다)"""
+    catalog = catalog_cache.get(_CATALOG_KEY)
+    if catalog is None:
+        catalog = await load_catalog(db)
+    return catalog
+
+
+async def resolve_session_names(db: AsyncSession, session_ids: Iterable[int]) -> dict[int, str]:
+    """
+    session_id → 이름. 없는 id는 결과에서 빠진다.
+    다른 워커에서 방금 추가된 세션일 수 있으므로, 모르는 id가 있으면 한 번 다시 읽고 확인한다.
+    """
+    session_ids = set(session_ids)
+    catalog = await get_catalog(db)
+    if not session_ids <= catalog.names.keys():
+        catalog = await load_catalog(db)
+    return {session_id: catalog.names[session_id] for session_id in session_ids if session_id in catalog.names}
+
+
+async def session_name(db: AsyncSession, session_id: int) -> str | None:
+    """session_id의 이름 (없는 세션이면 None)"""
+    return (await resolve_session_names(db, [session_id])).get(session_id)
@@ -0,0 +1,154 @@
+"""
+합주실 빈 시간 조회 벤치마크
+
+DATABASE_URL의 DB에 합주실 8곳 × 두 학기(366일) 분량의 예약(약 2만 건)을 넣고
+GET /api/reservations/availability 로 뒤 학기 전체(183일, 약 1만 건) / 전체 합주실 빈 시간을 조회한다.
+
+- endpoint: 앱을 프로세스 안에서 띄워(httpx ASGITransport) 인증 포함 전체 요청 시간
+- query / sweep: 사용 중 시간대 조회(인덱스 스캔 한 번)와 빈 시간 계산을 나눠 측정
+- per-day: 날짜마다 예약을 조회하는 방식(캘린더를 하루씩 넘겨 보는 것과 같음)과 비교
+
+    python -m scripts.bench_availability [반복 횟수]
+
+시드 데이터는 이름이 bench_ 로 시작하며, 끝나면 삭제한다. (운영 DB에서 실행하지 말 것)
+"""
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import httpx
+from sqlalchemy import select, text
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+from app.models.reservation import Reservation
+from app.services.availability import busy_intervals_query, free_slots
+from app.services.jwt import create_access_token
+
+ROOM_COUNT = 8
+SEMESTER_START = date(2031, 3, 2)
+SEMESTER_DAYS = 183
+# 조회 기간 밖의 예약도 있어야 인덱스 범위 스캔이 의미가 있다 → 앞 학기도 채운다
+SEED_START = SEMESTER_START - timedelta(days=SEMESTER_DAYS)
+KAKAO_ID_BASE = 9_100_000_000
+
+# 합주실마다 하루 8개 시간대 중 일부가 예약된다 (겹치지 않는 고정 시간대)
+SEED_SQL = [
+    f"INSERT INTO users (kakao_id, nickname) VALUES ({KAKAO_ID_BASE}, 'bench_user')",
+    f"INSERT INTO rooms (name) SELECT 'bench_room_' || g FROM generate_series(1, {ROOM_COUNT}) g",
+    f"""
+    INSERT INTO reservations (created_by, title, reservation_date, start_time, end_time, room_id)
+    SELECT (SELECT user_id FROM users WHERE kakao_id = {KAKAO_ID_BASE}),
+           'bench_reservation',
+           DATE '{SEED_START}' + d,
+           TIME '09:00' + k * INTERVAL '105 minute',
+           TIME '10:30' + k * INTERVAL '105 minute',
+           r.room_id
+    FROM rooms r
+    CROSS JOIN generate_series(0, {SEMESTER_DAYS * 2 - 1}) d
+    CROSS JOIN generate_series(0, 7) k
+    WHERE r.name LIKE 'bench_room_%'
+      AND (r.room_id * 7 + d * 3 + k * 5) % 8 <> 0
+    """,
+]
+
+CLEANUP_SQL = [
+    "DELETE FROM reservations WHERE title = 'bench_reservation'",
+    "DELETE FROM rooms WHERE name LIKE 'bench_room_%'",
+    f"DELETE FROM users WHERE kakao_id = {KAKAO_ID_BASE}",
+]
+
+
+async def run_sql(statements: list[str]):
+    async with engine.begin() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+
+
+def summary(samples: list[float]) -> str:
+    return f"median {statistics.median(samples):8.2f}ms  p95 {sorted(samples)[int(len(samples) * 0.95)]:8.2f}ms"
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    start = SEMESTER_START
+    end = start + timedelta(days=SEMESTER_DAYS - 1)
+    day_start, day_end = settings.availability_day_start, settings.availability_day_end
+
+    await run_sql(CLEANUP_SQL)
+    await run_sql(SEED_SQL)
+    try:
+        async with engine.connect() as conn:
+            user_id = (await conn.execute(text(f"SELECT user_id FROM users WHERE kakao_id = {KAKAO_ID_BASE}"))).scalar()
+            room_ids = (
+                await conn.execute(text("SELECT room_id FROM rooms WHERE name LIKE 'bench_room_%' ORDER BY room_id"))
+            ).scalars().all()
+            count = (await conn.execute(text("SELECT count(*) FROM reservations WHERE title = 'bench_reservation'"))).scalar()
+            await conn.execute(text("ANALYZE reservations"))
+            print(f"예약 {count}건, 합주실 {len(room_ids)}곳, 조회 {SEMESTER_DAYS}일\n")
+
+            query = busy_intervals_query(start, end)
+            compiled = query.compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+            plan = (await conn.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+            print("\n".join(plan), "\n")
+
+            busy_columns = query.selected_columns
+            query_ms, sweep_ms, per_day_ms = [], [], []
+            for _ in range(iterations):
+                t0 = time.perf_counter()
+                busy = (await conn.execute(query)).all()
+                t1 = time.perf_counter()
+                slots = free_slots(busy, room_ids, start, end, day_start, day_end, 60)
+                t2 = time.perf_counter()
+                query_ms.append((t1 - t0) * 1000)
+                sweep_ms.append((t2 - t1) * 1000)
+
+                # 비교: 날짜마다 조회
+                t0 = time.perf_counter()
+                per_day = []
+                day = start
+                while day <= end:
+                    per_day += (
+                        await conn.execute(
+                            select(*busy_columns)
+                            .where(
+                                Reservation.reservation_date == day,
+                                Reservation.room_id.is_not(None),
+                                Reservation.status != "cancelled",
+                            )
+                            .order_by(Reservation.room_id, Reservation.start_time)
+                        )
+                    ).all()
+                    day += timedelta(days=1)
+                per_day.sort(key=lambda row: tuple(row))
+                assert free_slots(per_day, room_ids, start, end, day_start, day_end, 60) == slots
+                per_day_ms.append((time.perf_counter() - t0) * 1000)
+
+        # 엔드포인트 전체 (다른 합주실이 있으면 그 빈 시간도 포함된다)
+        endpoint_ms = []
+        headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                params = {"from": str(start), "to": str(end)}
+                for _ in range(iterations):
+                    t0 = time.perf_counter()
+                    response = await client.get("/api/reservations/availability", params=params, headers=headers)
+                    endpoint_ms.append((time.perf_counter() - t0) * 1000)
+                    response.raise_for_status()
+
+        print(f"빈 시간대 {len(slots)}개 (60분 이상)")
+        print(f"   query: {summary(query_ms)}  (사용 중 시간대 {len(busy)}건)")
+        print(f"   sweep: {summary(sweep_ms)}")
+        print(f"endpoint: {summary(endpoint_ms)}  (응답 {len(response.content) // 1024}KB)")
+        print(f" per-day: {summary(per_day_ms)}  (쿼리 {SEMESTER_DAYS}회)")
+    finally:
+        await run_sql(CLEANUP_SQL)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+예약 변경 스트림(SSE) 구독자 벤치마크
+
+워커 하나에 유휴 구독자 N개(기본 5000)를 붙였을 때
+- 구독자당 메모리 (tracemalloc, 스트림 제너레이터 + 제한된 큐)
+- 이벤트 하나를 모든 구독자에게 넣고, 모든 스트림이 프레임을 내보낼 때까지 걸리는 시간
+- 읽지 않는 구독자가 섞여 있어도 큐가 event_queue_size를 넘지 않는지
+를 측정한다. (HTTP 연결 자체의 소켓/버퍼 메모리는 포함하지 않음, DB 불필요)
+
+    python -m scripts.bench_event_stream [구독자 수]
+"""
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+from app.config import settings
+from app.services.reservation_events import broker, publish, reservation_event, stream_frames
+
+
+async def consume(stream, received: list[int], ready: asyncio.Event):
+    await anext(stream)  # retry 프레임
+    ready.set()
+    async for _ in stream:
+        received[0] += 1
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    event = reservation_event(
+        "participants", 1, date(2026, 11, 3), delta=1, participant_count=4,
+    )
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    received = [0]
+    tasks = []
+    for _ in range(count):
+        ready = asyncio.Event()
+        tasks.append(asyncio.create_task(consume(stream_frames(), received, ready)))
+        await ready.wait()
+    idle = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"구독자 {len(broker.subscribers)}명, 구독자당 메모리 {(idle - before) / count / 1024:.2f}KB (유휴)")
+
+    fanout_ms = []
+    for _ in range(20):
+        target = received[0] + count
+        t0 = time.perf_counter()
+        publish(event)
+        while received[0] < target:
+            await asyncio.sleep(0)
+        fanout_ms.append((time.perf_counter() - t0) * 1000)
+    print(f"이벤트 1건 전달: median {statistics.median(fanout_ms):.2f}ms  max {max(fanout_ms):.2f}ms")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(f"연결 종료 후 구독자 {len(broker.subscribers)}명")
+
+    # 읽지 않는 구독자: 큐가 가득 차면 버리고 resync 하나만 남는다
+    slow = broker.subscribe()
+    for _ in range(settings.event_queue_size * 4):
+        publish(event)
+    print(f"읽지 않는 구독자 큐 {slow.queue.qsize()}/{settings.event_queue_size}, 버린 프레임 {broker.dropped}")
+    broker.unsubscribe(slow)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
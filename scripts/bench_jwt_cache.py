@@ -0,0 +1,41 @@
+"""
+JWT 검증 캐시 마이크로벤치마크
+
+같은 토큰을 반복 검증할 때 요청당 CPU 시간을 캐시 없이(매번 jose decode) / 캐시 적중으로 비교한다.
+DB 연결은 필요 없다.
+
+    python -m scripts.bench_jwt_cache [반복 횟수]
+"""
+import statistics
+import sys
+import time
+
+from app.services.jwt import clear_token_cache, create_access_token, verify_access_token
+
+
+def measure(iterations: int, cached: bool) -> list[float]:
+    """요청 1건당 CPU 시간(µs) 목록"""
+    token = create_access_token(1)
+    verify_access_token(token)
+    samples = []
+    for _ in range(iterations):
+        if not cached:
+            clear_token_cache()
+        start = time.process_time_ns()
+        verify_access_token(token)
+        samples.append((time.process_time_ns() - start) / 1000)
+    return samples
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    results = {name: measure(iterations, cached) for name, cached in (("no cache", False), ("cache hit", True))}
+
+    for name, samples in results.items():
+        print(f"{name:>9}: mean {statistics.fmean(samples):7.2f}µs  median {statistics.median(samples):7.2f}µs")
+    speedup = statistics.fmean(results["no cache"]) / statistics.fmean(results["cache hit"])
+    print(f"speedup: {speedup:.1f}x ({iterations}회)")
+
+
+if __name__ == "__main__":
+    main()
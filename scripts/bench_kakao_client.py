@@ -0,0 +1,257 @@
+"""
+카카오 OAuth 클라이언트 벤치마크 / 동작 점검 (로컬 스텁 서버)
+
+카카오 토큰/유저 정보 API를 흉내 내는 스텁 서버를 같은 프로세스에서 띄우고(uvicorn, 기본 TLS)
+app.services.kakao가 그 서버를 호출하게 한 뒤
+- latency: 로그인 1회(토큰 교환 + 유저 정보)를 호출마다 새 클라이언트로 / 공유 클라이언트로 N번 실행해 비교
+- 5xx 재시도: 유저 정보 조회는 KAKAO_MAX_RETRIES번까지 재시도, 토큰 교환(인가코드 1회용)은 재시도하지 않음
+- 타임아웃: 응답이 KAKAO_READ_TIMEOUT보다 늦으면 재시도 없이 실패, 연결 실패는 백오프하며 재시도
+를 확인한다. 외부 네트워크와 DB는 필요 없다. (TLS 인증서는 openssl로 임시 생성, 없으면 --no-tls와 같음)
+
+    python -m scripts.bench_kakao_client [-n 200] [--no-tls]
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from app.config import settings
+from app.services import kakao
+
+# 스텁 동작: 남은 5xx 응답 수와 응답 지연(초), 경로별 요청 수
+STATE = {"token_failures": 0, "user_failures": 0, "user_delay": 0.0, "hits": {"token": 0, "user": 0}}
+
+stub = FastAPI()
+
+
+@stub.post("/oauth/token")
+async def stub_token(request: Request):
+    STATE["hits"]["token"] += 1
+    if STATE["token_failures"] > 0:
+        STATE["token_failures"] -= 1
+        return Response(status_code=503)
+    form = dict(httpx.QueryParams((await request.body()).decode()))
+    return {"access_token": f"stub-{form.get('code', '')}"}
+
+
+@stub.get("/v2/user/me")
+async def stub_user_info():
+    STATE["hits"]["user"] += 1
+    if STATE["user_delay"]:
+        await asyncio.sleep(STATE["user_delay"])
+    if STATE["user_failures"] > 0:
+        STATE["user_failures"] -= 1
+        return Response(status_code=503)
+    return {"id": 42, "kakao_account": {"profile": {"nickname": "stub", "profile_image_url": None}}}
+
+
+def reset_state(**values):
+    STATE.update(token_failures=0, user_failures=0, user_delay=0.0, hits={"token": 0, "user": 0})
+    STATE.update(values)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_certificate(directory: Path) -> tuple[Path, Path] | None:
+    """localhost용 자체 서명 인증서 (openssl이 없으면 None)"""
+    if shutil.which("openssl") is None:
+        return None
+    cert, key = directory / "stub.crt", directory / "stub.key"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", str(key), "-out", str(cert), "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def point_to(base_url: str):
+    kakao.KAKAO_TOKEN_URL = f"{base_url}/oauth/token"
+    kakao.KAKAO_USER_INFO_URL = f"{base_url}/v2/user/me"
+
+
+async def reset_client():
+    """바뀐 설정(타임아웃 등)으로 공유 클라이언트를 다시 만든다."""
+    await kakao.close_client()
+    await kakao.start_client()
+
+
+async def login_per_call_clients(code: str) -> dict:
+    """변경 전 방식: 호출마다 클라이언트를 만들고 닫는다 (매번 TCP/TLS 핸드셰이크)"""
+    async with httpx.AsyncClient() as client:
+        response = await client.post(kakao.KAKAO_TOKEN_URL, data={"code": code})
+        access_token = response.json()["access_token"]
+    async with httpx.AsyncClient() as client:
+        response = await client.get(kakao.KAKAO_USER_INFO_URL, headers={"Authorization": f"Bearer {access_token}"})
+        return response.json()
+
+
+async def login_shared_client(code: str) -> dict:
+    return await kakao.get_kakao_user_info(await kakao.get_kakao_access_token(code, "http://stub"))
+
+
+async def measure_latency(count: int):
+    for name, login in (("per-call clients", login_per_call_clients), ("shared client", login_shared_client)):
+        await login("warmup")
+        samples = []
+        for i in range(count):
+            start = time.perf_counter()
+            await login(str(i))
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        print(
+            f"{name:>16}: p50 {statistics.median(samples):6.2f}ms  "
+            f"p95 {samples[int(len(samples) * 0.95)]:6.2f}ms  ({count}회 로그인)"
+        )
+
+
+async def expect_error(coro, error: type[Exception]) -> tuple[Exception | None, float]:
+    start = time.perf_counter()
+    try:
+        await coro
+    except error as exc:
+        return exc, time.perf_counter() - start
+    return None, time.perf_counter() - start
+
+
+def report(name: str, ok: bool, detail: str) -> bool:
+    print(f"[{'OK' if ok else 'FAIL'}] {name}: {detail}")
+    return ok
+
+
+async def check_retries() -> list[bool]:
+    retries = settings.kakao_max_retries
+    results = []
+
+    # 유저 정보: 재시도 횟수 안에서 5xx가 끝나면 성공
+    reset_state(user_failures=retries)
+    user = await login_shared_client("retry")
+    results.append(
+        report(
+            "유저 정보 5xx 후 성공",
+            user["kakao_id"] == 42 and STATE["hits"]["user"] == retries + 1,
+            f"5xx {retries}번 → 요청 {STATE['hits']['user']}번 후 성공",
+        )
+    )
+
+    # 유저 정보: 계속 5xx면 재시도 후 HTTPStatusError
+    reset_state(user_failures=retries + 1)
+    exc, _ = await expect_error(kakao.get_kakao_user_info("stub"), httpx.HTTPStatusError)
+    results.append(
+        report(
+            "유저 정보 5xx 계속",
+            exc is not None and STATE["hits"]["user"] == retries + 1,
+            f"요청 {STATE['hits']['user']}번 후 {type(exc).__name__ if exc else '예외 없음'}",
+        )
+    )
+
+    # 토큰 교환: 인가코드가 이미 소모됐을 수 있으므로 5xx는 재시도하지 않는다
+    reset_state(token_failures=1)
+    exc, _ = await expect_error(kakao.get_kakao_access_token("once", "http://stub"), httpx.HTTPStatusError)
+    results.append(
+        report(
+            "토큰 교환 5xx",
+            exc is not None and STATE["hits"]["token"] == 1,
+            f"요청 {STATE['hits']['token']}번 (재시도 없음)",
+        )
+    )
+    return results
+
+
+async def check_timeouts(closed_port_url: str) -> list[bool]:
+    results = []
+    read_timeout = settings.kakao_read_timeout
+
+    # 응답 지연: 읽기 타임아웃 뒤 재시도 없이 실패 (요청이 이미 처리됐을 수 있음)
+    reset_state(user_delay=read_timeout * 3)
+    exc, elapsed = await expect_error(kakao.get_kakao_user_info("stub"), httpx.ReadTimeout)
+    results.append(
+        report(
+            "읽기 타임아웃",
+            exc is not None and STATE["hits"]["user"] == 1 and elapsed < read_timeout * 2,
+            f"{elapsed:.2f}s 후 {type(exc).__name__ if exc else '예외 없음'} (타임아웃 {read_timeout}s, 요청 {STATE['hits']['user']}번)",
+        )
+    )
+    reset_state()
+
+    # 연결 실패: 요청이 전송되지 않았으므로 백오프하며 재시도한 뒤 실패
+    backoff = sum(settings.kakao_retry_backoff * 2**attempt for attempt in range(settings.kakao_max_retries))
+    point_to(closed_port_url)
+    try:
+        exc, elapsed = await expect_error(kakao.get_kakao_access_token("code", "http://stub"), httpx.ConnectError)
+    finally:
+        point_to(STATE["base_url"])
+    results.append(
+        report(
+            "연결 실패 재시도",
+            exc is not None and elapsed >= backoff,
+            f"{elapsed:.2f}s 후 {type(exc).__name__ if exc else '예외 없음'} (재시도 {settings.kakao_max_retries}번, 백오프 합 {backoff:.2f}s)",
+        )
+    )
+    return results
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="카카오 OAuth 클라이언트 벤치마크 (로컬 스텁)")
+    parser.add_argument("-n", "--logins", type=int, default=200, help="측정할 로그인 횟수")
+    parser.add_argument("--no-tls", action="store_true", help="스텁 서버를 HTTP로 띄운다")
+    args = parser.parse_args()
+
+    # 점검이 빨리 끝나도록 타임아웃/백오프를 줄인다 (재시도 횟수는 설정값 그대로)
+    settings.kakao_read_timeout = 0.5
+    settings.kakao_retry_backoff = 0.05
+
+    with tempfile.TemporaryDirectory() as directory:
+        certificate = None if args.no_tls else make_certificate(Path(directory))
+        ssl_options = {}
+        scheme = "http"
+        if certificate is not None:
+            cert, key = certificate
+            ssl_options = {"ssl_certfile": str(cert), "ssl_keyfile": str(key)}
+            scheme = "https"
+            # httpx는 SSL_CERT_FILE을 신뢰 저장소로 쓴다 (공유 클라이언트, 호출마다 만드는 클라이언트 모두)
+            os.environ["SSL_CERT_FILE"] = str(cert)
+
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(stub, host="127.0.0.1", port=port, log_level="warning", **ssl_options))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        STATE["base_url"] = f"{scheme}://localhost:{port}"
+        point_to(STATE["base_url"])
+        await reset_client()
+        try:
+            print(f"스텁 서버 {STATE['base_url']}\n")
+            await measure_latency(args.logins)
+            print()
+            results = await check_retries() + await check_timeouts(f"{scheme}://localhost:{free_port()}")
+        finally:
+            await kakao.close_client()
+            server.should_exit = True
+            await serving
+
+    if not all(results):
+        raise SystemExit(f"{results.count(False)}개 점검 실패")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
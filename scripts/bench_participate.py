@@ -0,0 +1,152 @@
+"""
+예약 참가 신청 동시성 점검 / 벤치마크
+
+정원(max_participants)이 작은 예약 하나에 서로 다른 유저 N명(기본 300)이 동시에
+POST /api/reservations/{id}/participate 를 보냈을 때
+- 정확히 정원만큼만 201이고 나머지는 400인지
+- participant_count가 확정(confirmed) 참가 행 수와 같은지
+를 확인하고, 전체 소요 시간과 요청별 지연을 출력한다. (앱은 httpx ASGITransport로 프로세스 안에서 띄움)
+
+    python -m scripts.bench_participate --confirm-db <DB 이름> [-n 300] [--max 10]
+
+시드 유저는 kakao_id 범위로 구분하고, 예약/참가 기록은 그 유저를 통해 찾아 끝나면 삭제한다.
+시드 데이터를 넣고 지우므로 대상 DB 이름을 --confirm-db로 직접 적어야 실행된다. (운영 DB에서 실행하지 말 것)
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+from app.services.jwt import create_access_token
+
+KAKAO_ID_BASE = 9_200_000_000
+# 시드 유저 수의 상한 (정리 시 이 범위 전체를 지운다)
+MAX_USERS = 10_000
+
+SEED_USERS = f"SELECT user_id FROM users WHERE kakao_id > {KAKAO_ID_BASE} AND kakao_id <= {KAKAO_ID_BASE + MAX_USERS}"
+SEED_RESERVATIONS = f"SELECT reservation_id FROM reservations WHERE created_by IN ({SEED_USERS})"
+
+CLEANUP_SQL = [
+    f"""
+    DELETE FROM reservation_participants
+    WHERE reservation_id IN ({SEED_RESERVATIONS}) OR user_id IN ({SEED_USERS})
+    """,
+    f"DELETE FROM reservations WHERE reservation_id IN ({SEED_RESERVATIONS})",
+    f"DELETE FROM users WHERE user_id IN ({SEED_USERS})",
+]
+
+
+def confirm_database(confirmed: str | None):
+    """시드 데이터를 넣고 지우기 전에, --confirm-db로 적은 이름이 실제 대상 DB와 같은지 확인한다."""
+    target = make_url(settings.database_url)
+    if confirmed != target.database:
+        raise SystemExit(
+            f"대상 DB {target.database!r}에 시드 데이터를 넣고 삭제합니다. "
+            f"운영 DB가 아닌지 확인한 뒤 --confirm-db {target.database} 를 붙여 실행하세요."
+        )
+
+
+async def run_sql(statements: list[str]):
+    async with engine.begin() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+
+
+async def seed(user_count: int, max_participants: int) -> tuple[int, list[int]]:
+    """시드 유저 user_count명과 정원 max_participants인 예약 하나 → (예약 id, 유저 id 목록)"""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                f"""
+                INSERT INTO users (kakao_id, nickname)
+                SELECT {KAKAO_ID_BASE} + g, 'bench_participant_' || g
+                FROM generate_series(1, {user_count}) g
+                """
+            )
+        )
+        user_ids = list((await conn.execute(text(f"{SEED_USERS} ORDER BY user_id"))).scalars())
+        reservation_id = (
+            await conn.execute(
+                text(
+                    f"""
+                    INSERT INTO reservations (created_by, title, reservation_date, start_time, end_time, max_participants)
+                    VALUES ({user_ids[0]}, 'bench_participate', DATE '2031-05-01', TIME '19:00', TIME '21:00', {max_participants})
+                    RETURNING reservation_id
+                    """
+                )
+            )
+        ).scalar()
+    return reservation_id, user_ids
+
+
+async def participate(client: httpx.AsyncClient, reservation_id: int, headers: dict) -> tuple[int, float]:
+    start = time.perf_counter()
+    response = await client.post(f"/api/reservations/{reservation_id}/participate", headers=headers)
+    return response.status_code, (time.perf_counter() - start) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="예약 참가 신청 동시성 점검")
+    parser.add_argument("-n", "--requests", type=int, default=300, help="동시 참가 신청 수 (유저마다 1건)")
+    parser.add_argument("--max", type=int, default=10, help="예약 정원 (max_participants)")
+    parser.add_argument("--confirm-db", metavar="NAME", help="대상 DB 이름 (DATABASE_URL의 DB와 같아야 실행된다)")
+    args = parser.parse_args()
+    confirm_database(args.confirm_db)
+    if not 0 < args.max < args.requests <= MAX_USERS:
+        raise SystemExit(f"0 < --max < -n <= {MAX_USERS} 이어야 합니다")
+
+    await run_sql(CLEANUP_SQL)
+    reservation_id, user_ids = await seed(args.requests, args.max)
+    headers = [{"Authorization": f"Bearer {create_access_token(user_id)}"} for user_id in user_ids]
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                started = time.perf_counter()
+                results = await asyncio.gather(*(participate(client, reservation_id, h) for h in headers))
+                elapsed = time.perf_counter() - started
+
+        async with engine.connect() as conn:
+            participant_count, confirmed = (
+                await conn.execute(
+                    text(
+                        f"""
+                        SELECT r.participant_count,
+                               (SELECT count(*) FROM reservation_participants p
+                                WHERE p.reservation_id = r.reservation_id AND p.status = 'confirmed')
+                        FROM reservations r WHERE r.reservation_id = {reservation_id}
+                        """
+                    )
+                )
+            ).one()
+    finally:
+        await run_sql(CLEANUP_SQL)
+        await engine.dispose()
+
+    statuses = Counter(status_code for status_code, _ in results)
+    latencies = sorted(latency for _, latency in results)
+    print(f"동시 참가 신청 {args.requests}건, 정원 {args.max}명")
+    print(f"  응답: {dict(sorted(statuses.items()))}")
+    print(f"  participant_count {participant_count}, 확정 참가 행 {confirmed}")
+    print(f"  전체 {elapsed * 1000:.1f}ms ({args.requests / elapsed:.0f} req/s)")
+    print(
+        f"  요청별 median {statistics.median(latencies):.2f}ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95)]:.2f}ms  max {latencies[-1]:.2f}ms"
+    )
+
+    assert statuses[201] == args.max, f"201 응답이 정원({args.max})과 다릅니다: {statuses[201]}"
+    assert statuses[400] == args.requests - args.max, f"400 응답 수가 맞지 않습니다: {dict(statuses)}"
+    assert participant_count == confirmed == args.max, "participant_count와 확정 참가 행 수가 정원과 다릅니다"
+    print("OK: 정원 초과 없음")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
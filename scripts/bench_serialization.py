@@ -0,0 +1,97 @@
+"""
+월별 예약 목록 직렬화 마이크로벤치마크
+
+예약 500건짜리 한 달 목록을 기준으로 두 경로의 응답 본문 생성 시간을 비교한다. DB 연결은 필요 없다.
+- pydantic: ReservationResponse 목록을 만든 뒤 FastAPI가 response_model로 다시 검증/직렬화하고 JSONResponse로 인코딩
+- orjson:   schema_columns로 조회한 Row를 dump_rows로 바로 JSON 바이트로 변환 (현재 get_reservations 경로)
+
+    python -m scripts.bench_serialization [예약 수] [반복 횟수]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import select
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from app.routers.reservations import RESERVATION_LIST_COLUMNS
+from app.schemas.reservation import ReservationResponse
+from app.services.serialization import dump_rows
+
+
+def make_rows(count: int):
+    """RESERVATION_LIST_COLUMNS와 같은 라벨의 Row 목록 (DB 없이)"""
+    keys = [column.name for column in select(*RESERVATION_LIST_COLUMNS).selected_columns]
+    created = datetime(2025, 2, 1, 10, 0, 0, 123456)
+    tuples = [
+        (
+            i,
+            i % 300 + 1,
+            f"멤버{i % 300}",
+            f"합주 {i}",
+            date(2025, 3, 1) + timedelta(days=i % 31),
+            dtime(9 + i % 12, 0),
+            dtime(10 + i % 12, 30),
+            "합주실 A" if i % 2 else None,
+            i % 3 or None,
+            "정기 합주" if i % 3 else None,
+            "open",
+            8 if i % 4 else None,
+            i % 8,
+            i % 5 or None,
+            created + timedelta(minutes=i),
+            created + timedelta(hours=i),
+        )
+        for i in range(1, count + 1)
+    ]
+    return IteratorResult(SimpleResultMetaData(keys), iter(tuples)).all()
+
+
+async def pydantic_path(field, rows) -> bytes:
+    # 이전 get_reservations: 모델 생성 → FastAPI response_model 검증/직렬화 → JSONResponse
+    reservations = [ReservationResponse(**row._mapping) for row in rows]
+    content = await serialize_response(field=field, response_content=reservations)
+    return JSONResponse(content).body
+
+
+def orjson_path(rows) -> bytes:
+    return dump_rows(rows)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = make_rows(count)
+    field = create_model_field(name="Response_get_reservations", type_=list[ReservationResponse], mode="serialization")
+
+    async def measure(fn) -> list[float]:
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            result = fn()
+            if asyncio.iscoroutine(result):
+                await result
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    # 두 경로의 결과가 같은 JSON인지 먼저 확인
+    assert json.loads(await pydantic_path(field, rows)) == json.loads(orjson_path(rows))
+
+    results = {
+        "pydantic": await measure(lambda: pydantic_path(field, rows)),
+        "orjson": await measure(lambda: orjson_path(rows)),
+    }
+    for name, samples in results.items():
+        print(f"{name:>8}: median {statistics.median(samples):7.3f}ms  p95 {sorted(samples)[int(len(samples) * 0.95)]:7.3f}ms")
+    speedup = statistics.median(results["pydantic"]) / statistics.median(results["orjson"])
+    print(f"speedup: {speedup:.1f}x (예약 {count}건, {iterations}회)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
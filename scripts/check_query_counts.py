@@ -0,0 +1,162 @@
+"""
+엔드포인트별 SQL 문 수 점검 (N+1 회귀 확인)
+
+앱을 프로세스 안에서 띄우고(httpx ASGITransport) 참가자/멤버가 여러 명인 데이터를 넣은 뒤,
+각 엔드포인트 요청 하나가 실행한 SQL 문 수가 상한을 넘지 않는지 assert_max_queries로 확인한다.
+참가자/멤버 수와 관계없이 같은 수여야 하므로, 관계를 행마다 따로 읽으면(N+1) 바로 실패한다.
+인증(get_current_user)은 유저 캐시를 먼저 채운 뒤 측정하므로 개수에 들어가지 않는다.
+
+    python -m scripts.check_query_counts --confirm-db <DB 이름>
+
+시드 유저는 kakao_id 범위로, 팀/세션은 이름 접두어로 구분하고 끝나면 삭제한다.
+시드 데이터를 넣고 지우므로 대상 DB 이름을 --confirm-db로 직접 적어야 실행된다. (운영 DB에서 실행하지 말 것)
+"""
+import argparse
+import asyncio
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+from app.services.jwt import create_access_token
+from app.services.query_stats import assert_max_queries
+
+KAKAO_ID_BASE = 9_300_000_000
+USER_COUNT = 30
+
+SEED_USERS = f"SELECT user_id FROM users WHERE kakao_id > {KAKAO_ID_BASE} AND kakao_id <= {KAKAO_ID_BASE + USER_COUNT}"
+SEED_RESERVATIONS = f"SELECT reservation_id FROM reservations WHERE created_by IN ({SEED_USERS})"
+SEED_TEAMS = r"SELECT team_id FROM teams WHERE name LIKE 'qc\_team\_%'"
+SEED_SESSIONS = r"SELECT session_id FROM sessions WHERE name LIKE 'qc\_session\_%'"
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (kakao_id, nickname, role)
+    SELECT {KAKAO_ID_BASE} + g, 'qc_user_' || g, CASE WHEN g = 1 THEN 'admin' ELSE 'member' END
+    FROM generate_series(1, {USER_COUNT}) g
+    """,
+    "INSERT INTO sessions (name) VALUES ('qc_session_1')",
+    "INSERT INTO teams (name) VALUES ('qc_team_1')",
+    f"""
+    INSERT INTO reservations (created_by, title, reservation_date, start_time, end_time, participant_count)
+    SELECT min(user_id), 'qc_reservation', DATE '2031-06-01', TIME '19:00', TIME '21:00', {USER_COUNT - 1}
+    FROM ({SEED_USERS}) seed_users
+    """,
+    # 유저 1을 뺀 모두가 예약 참가자이자 팀 멤버 → 관계를 행마다 읽으면 쿼리가 수십 개가 된다
+    f"""
+    INSERT INTO reservation_participants (reservation_id, user_id)
+    SELECT r.reservation_id, u.user_id
+    FROM ({SEED_RESERVATIONS}) r CROSS JOIN ({SEED_USERS} ORDER BY user_id OFFSET 1) u
+    """,
+    f"""
+    INSERT INTO team_members (team_id, user_id, session_id)
+    SELECT t.team_id, u.user_id, s.session_id
+    FROM ({SEED_TEAMS}) t CROSS JOIN ({SEED_SESSIONS}) s CROSS JOIN ({SEED_USERS} ORDER BY user_id OFFSET 2) u
+    """,
+]
+
+CLEANUP_SQL = [
+    f"""
+    DELETE FROM reservation_participants
+    WHERE reservation_id IN ({SEED_RESERVATIONS}) OR user_id IN ({SEED_USERS})
+    """,
+    f"DELETE FROM reservations WHERE reservation_id IN ({SEED_RESERVATIONS})",
+    f"DELETE FROM team_members WHERE team_id IN ({SEED_TEAMS}) OR user_id IN ({SEED_USERS})",
+    f"DELETE FROM teams WHERE team_id IN ({SEED_TEAMS})",
+    f"DELETE FROM sessions WHERE session_id IN ({SEED_SESSIONS})",
+    f"DELETE FROM users WHERE user_id IN ({SEED_USERS})",
+]
+
+
+def confirm_database(confirmed: str | None):
+    """시드 데이터를 넣고 지우기 전에, --confirm-db로 적은 이름이 실제 대상 DB와 같은지 확인한다."""
+    target = make_url(settings.database_url)
+    if confirmed != target.database:
+        raise SystemExit(
+            f"대상 DB {target.database!r}에 시드 데이터를 넣고 삭제합니다. "
+            f"운영 DB가 아닌지 확인한 뒤 --confirm-db {target.database} 를 붙여 실행하세요."
+        )
+
+
+async def run_sql(statements: list[str]):
+    async with engine.begin() as conn:
+        for statement in statements:
+            await conn.execute(text(statement))
+
+
+async def seed() -> dict:
+    await run_sql(SEED_SQL)
+    async with engine.connect() as conn:
+        user_ids = list((await conn.execute(text(f"{SEED_USERS} ORDER BY user_id"))).scalars())
+        return {
+            "admin_id": user_ids[0],
+            # 참가자이지만 아직 팀 멤버는 아니다 (팀 멤버는 세 번째 유저부터) → 멤버 추가에도 쓴다
+            "member_id": user_ids[1],
+            "reservation_id": (await conn.execute(text(SEED_RESERVATIONS))).scalar(),
+            "team_id": (await conn.execute(text(SEED_TEAMS))).scalar(),
+            "session_id": (await conn.execute(text(SEED_SESSIONS))).scalar(),
+        }
+
+
+def checks(ids: dict) -> list[tuple[str, int, str, str, dict | None, int]]:
+    """(이름, 최대 쿼리 수, 메서드, 경로, JSON 본문, 기대 상태 코드)"""
+    return [
+        # 예약 + 참가자(유저 조인)
+        ("GET /reservations/{id}", 2, "GET", f"/api/reservations/{ids['reservation_id']}", None, 200),
+        # 팀/유저/중복 확인 + 멤버 추가와 팀 updated_at 갱신 (세션은 카탈로그)
+        (
+            "POST /teams/{id}/members",
+            2,
+            "POST",
+            f"/api/teams/{ids['team_id']}/members",
+            {"user_id": ids["member_id"], "session_id": ids["session_id"]},
+            201,
+        ),
+        # 팀 + 멤버 + 멤버 유저 (세션 이름은 카탈로그)
+        ("GET /teams/{id}", 3, "GET", f"/api/teams/{ids['team_id']}", None, 200),
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="엔드포인트별 SQL 문 수 점검")
+    parser.add_argument("--confirm-db", metavar="NAME", help="대상 DB 이름 (DATABASE_URL의 DB와 같아야 실행된다)")
+    args = parser.parse_args()
+    confirm_database(args.confirm_db)
+
+    await run_sql(CLEANUP_SQL)
+    ids = await seed()
+    # 관리자(멤버 추가)와 일반 멤버(조회)
+    admin = {"Authorization": f"Bearer {create_access_token(ids['admin_id'])}"}
+    member = {"Authorization": f"Bearer {create_access_token(ids['member_id'])}"}
+    failures = 0
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+                # 인증 유저 캐시를 채운다
+                for headers in (admin, member):
+                    (await client.get("/api/auth/me", headers=headers)).raise_for_status()
+
+                for name, limit, method, path, body, expected in checks(ids):
+                    headers = admin if method != "GET" else member
+                    try:
+                        with assert_max_queries(limit) as stats:
+                            response = await client.request(method, path, json=body, headers=headers)
+                        assert response.status_code == expected, f"상태 코드 {response.status_code}: {response.text}"
+                        print(f"[OK] {name}: 쿼리 {stats.count}개 (최대 {limit}개)")
+                    except AssertionError as exc:
+                        failures += 1
+                        print(f"[FAIL] {name}: {exc}")
+    finally:
+        await run_sql(CLEANUP_SQL)
+        await engine.dispose()
+
+    if failures:
+        raise SystemExit(f"{failures}개 엔드포인트가 쿼리 수 상한을 넘었습니다")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,211 @@
+"""
+라우터 핫패스 쿼리 실행 계획 점검 스크립트
+
+DATABASE_URL의 DB에 트랜잭션을 열고 테스트 데이터를 넣은 뒤 ANALYZE → EXPLAIN을 실행한다.
+마지막에 롤백하므로 기존 데이터는 바뀌지 않는다. (alembic upgrade head 이후 실행)
+
+    python -m scripts.explain_queries
+"""
+import asyncio
+import json
+from datetime import date
+
+from sqlalchemy import or_, select, text, tuple_
+
+from app.database import engine
+from app.models import Notice, Reservation, ReservationParticipant, TeamMember, User, UserSession
+from app.routers.notices import NOTICE_LIST_COLUMNS
+from app.services.notice_search import notice_search_query
+from app.services.search import contains_pattern
+
+INDEX_NODE_TYPES = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+SEED_SQL = [
+    """
+    INSERT INTO users (kakao_id, nickname, affiliation)
+    SELECT 9000000000 + g, 'bench_user_' || substr(md5(g::text), 1, 8), 'GAA'
+    FROM generate_series(1, 3000) g
+    """,
+    "INSERT INTO sessions (name) SELECT 'bench_session_' || g FROM generate_series(1, 10) g",
+    """
+    INSERT INTO user_sessions (user_id, session_id, is_main)
+    SELECT u.user_id, s.session_id, s.session_id % 10 = u.user_id % 10
+    FROM (SELECT user_id FROM users WHERE nickname LIKE 'bench_user_%') u
+    CROSS JOIN LATERAL (
+        SELECT session_id FROM sessions WHERE name LIKE 'bench_session_%'
+        ORDER BY (session_id + u.user_id) % 10 LIMIT 3
+    ) s
+    """,
+    "INSERT INTO teams (name) SELECT 'bench_team_' || g FROM generate_series(1, 500) g",
+    """
+    INSERT INTO team_members (team_id, user_id, session_id)
+    SELECT t.team_id, u.user_id, (SELECT min(session_id) FROM sessions)
+    FROM (SELECT team_id, row_number() OVER (ORDER BY team_id) AS rn FROM teams WHERE name LIKE 'bench_team_%') t
+    JOIN (SELECT user_id, row_number() OVER (ORDER BY user_id) AS rn FROM users WHERE nickname LIKE 'bench_user_%') u
+      ON u.rn BETWEEN (t.rn - 1) * 5 + 1 AND t.rn * 5
+    """,
+    """
+    INSERT INTO reservations (created_by, title, reservation_date, start_time, end_time)
+    SELECT (SELECT min(user_id) FROM users WHERE nickname LIKE 'bench_user_%') + g % 3000,
+           'bench_reservation_' || g,
+           DATE '2024-03-01' + (g % 1095),
+           TIME '09:00' + (g % 12) * INTERVAL '1 hour',
+           TIME '10:00' + (g % 12) * INTERVAL '1 hour'
+    FROM generate_series(1, 30000) g
+    """,
+    """
+    INSERT INTO reservation_participants (reservation_id, user_id)
+    SELECT r.reservation_id, (SELECT min(user_id) FROM users WHERE nickname LIKE 'bench_user_%') + (r.reservation_id * 7 + k) % 3000
+    FROM reservations r CROSS JOIN generate_series(1, 4) k
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO notices (author_id, title, content, created_at)
+    SELECT (SELECT min(user_id) FROM users WHERE nickname LIKE 'bench_user_%'), 'bench_notice_' || g,
+           md5(g::text) || ' ' || repeat('공지 내용 ', 50) || CASE WHEN g % 1000 = 0 THEN '방음문 공사 안내' ELSE '' END,
+           now() - g * INTERVAL '1 hour'
+    FROM generate_series(1, 20000) g
+    """,
+]
+
+
+def hot_path_queries(sample: dict) -> list[tuple[str, str, object]]:
+    """(이름, 인덱스를 타야 하는 테이블, 쿼리) — 각 라우터와 같은 조건"""
+    return [
+        (
+            "reservations.get_reservations (month)",
+            "reservations",
+            select(Reservation, User.nickname)
+            .join(User, Reservation.created_by == User.user_id)
+            .where(Reservation.reservation_date >= date(2025, 3, 1), Reservation.reservation_date < date(2025, 4, 1))
+            .order_by(Reservation.reservation_date, Reservation.start_time),
+        ),
+        (
+            "reservations.get_reservation (participants)",
+            "reservation_participants",
+            select(ReservationParticipant).where(ReservationParticipant.reservation_id.in_([sample["reservation_id"]])),
+        ),
+        (
+            "reservations.cancel_participation",
+            "reservation_participants",
+            select(ReservationParticipant).where(
+                ReservationParticipant.reservation_id == sample["reservation_id"],
+                ReservationParticipant.user_id == sample["user_id"],
+            ),
+        ),
+        (
+            "notices.get_notices (page 1)",
+            "notices",
+            select(*NOTICE_LIST_COLUMNS)
+            .select_from(Notice)
+            .join(User, Notice.author_id == User.user_id)
+            .order_by(Notice.created_at.desc(), Notice.notice_id.desc())
+            .limit(21),
+        ),
+        (
+            "notices.get_notices (cursor)",
+            "notices",
+            select(*NOTICE_LIST_COLUMNS)
+            .select_from(Notice)
+            .join(User, Notice.author_id == User.user_id)
+            .where(tuple_(Notice.created_at, Notice.notice_id) < (sample["notice_created_at"], sample["notice_id"]))
+            .order_by(Notice.created_at.desc(), Notice.notice_id.desc())
+            .limit(21),
+        ),
+        # 시드 공지 1000건 중 1건 본문에만 "방음문"이 있다
+        (
+            "notices.search_notices",
+            "notices",
+            notice_search_query("방음문").limit(21),
+        ),
+        (
+            "teams.get_team (members)",
+            "team_members",
+            select(TeamMember).where(TeamMember.team_id.in_([sample["team_id"]])),
+        ),
+        (
+            "sessions.add_my_session (main session)",
+            "user_sessions",
+            select(UserSession).where(UserSession.user_id == sample["user_id"], UserSession.is_main == True),
+        ),
+        (
+            "users.get_users (page)",
+            "users",
+            select(User).order_by(User.nickname, User.user_id).limit(51),
+        ),
+        # "dc9bd"는 md5('1234')의 일부 → 시드 닉네임 한 건과 일치
+        (
+            "users.get_users (search)",
+            "users",
+            select(User)
+            .where(
+                or_(
+                    User.nickname.ilike(contains_pattern("dc9bd"), escape="\\"),
+                    User.affiliation.ilike(contains_pattern("dc9bd"), escape="\\"),
+                )
+            )
+            .order_by(User.nickname, User.user_id)
+            .limit(51),
+        ),
+    ]
+
+
+def index_nodes(plan: dict, table: str) -> list[str]:
+    """실행 계획 트리에서 해당 테이블에 대한 인덱스 스캔 노드를 모은다."""
+    found = []
+    if plan.get("Node Type") in INDEX_NODE_TYPES and plan.get("Relation Name", table) == table:
+        found.append(f'{plan["Node Type"]} using {plan.get("Index Name")}')
+    for child in plan.get("Plans", []):
+        found.extend(index_nodes(child, table))
+    return found
+
+
+async def main():
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            for sql in SEED_SQL:
+                await conn.execute(text(sql))
+            # 방금 넣은 GIN 인덱스 항목은 pending list에 쌓여 있어 비용이 과대평가되므로 먼저 정리한다
+            await conn.execute(
+                text(
+                    "SELECT gin_clean_pending_list(c.oid::regclass) FROM pg_class c "
+                    "JOIN pg_am am ON am.oid = c.relam "
+                    "WHERE am.amname = 'gin' AND c.relnamespace = 'public'::regnamespace"
+                )
+            )
+            await conn.execute(text("ANALYZE"))
+
+            sample = (
+                await conn.execute(
+                    text(
+                        "SELECT (SELECT max(reservation_id) FROM reservations) AS reservation_id, "
+                        "(SELECT max(user_id) FROM users) AS user_id, "
+                        "(SELECT max(team_id) FROM teams) AS team_id, "
+                        "(SELECT min(notice_id) + 10000 FROM notices) AS notice_id, "
+                        "(SELECT created_at FROM notices ORDER BY notice_id LIMIT 1 OFFSET 10000) AS notice_created_at"
+                    )
+                )
+            ).mappings().one()
+
+            failures = 0
+            for name, table, query in hot_path_queries(dict(sample)):
+                compiled = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+                result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                plan = result.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                nodes = index_nodes(plan[0]["Plan"], table)
+                if not nodes:
+                    failures += 1
+                print(f"[{'OK' if nodes else 'NO INDEX'}] {name}")
+                print(f"    {', '.join(nodes) if nodes else plan[0]['Plan']['Node Type']}")
+        finally:
+            await trans.rollback()
+
+    await engine.dispose()
+    if failures:
+        raise SystemExit(f"{failures}개 쿼리가 인덱스를 사용하지 않습니다")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,381 @@
+"""
+HTTP 부하 테스트 / 벤치마크
+
+app.main:app을 프로세스 안에서 띄우고(httpx ASGITransport) DATABASE_URL의 DB에
+테스트 데이터를 넣은 뒤, 여러 엔드포인트를 섞은 동시 요청을 보낸다.
+카카오 API는 로컬 스텁으로 대체하므로 외부 네트워크가 필요 없다.
+
+    python -m scripts.load_test --confirm-db <DB 이름>                 # 기본: 동시 20, 30초
+    python -m scripts.load_test --confirm-db <DB 이름> -c 50 -d 60
+    python -m scripts.load_test --confirm-db <DB 이름> --compare load_test_results/이전결과.json
+
+- 엔드포인트별 처리량(req/s), p50/p95/p99 지연(ms), 요청당 DB 쿼리 수를 출력하고
+  load_test_results/ 아래에 JSON으로 저장한다 (커밋 간 비교용).
+- 지연 시간은 네트워크를 거치지 않은 앱 + DB 처리 시간이다.
+- 시드 유저는 kakao_id 범위(KAKAO_ID_BASE + 1 ~ USER_COUNT)로 구분하고, 예약/공지/참가 기록은 그 유저를 통해 찾는다.
+  팀/세션은 이름 접두어 load_team_ / load_session_ 으로 구분한다. 끝나면 모두 삭제한다.
+- 시드 데이터를 넣고 지우므로 대상 DB 이름을 --confirm-db로 직접 적어야 실행된다. (운영 DB에서 실행하지 말 것)
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.database import engine, pool_status
+from app.main import app
+from app.services import kakao
+from app.services.cache import all_cache_stats
+from app.services.jwt import create_access_token
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.services.query_stats import collect_queries
+
+RESULTS_DIR = Path("load_test_results")
+
+USER_COUNT = 300
+TEAM_COUNT = 60
+NOTICE_COUNT = 500
+MONTHS = [(2025, 3), (2025, 4), (2025, 5)]
+RESERVATIONS_PER_DAY = 6
+# 참가/취소가 몰리는 예약 수와 정원
+HOT_RESERVATIONS = 5
+HOT_MAX_PARTICIPANTS = 15
+KAKAO_ID_BASE = 8_000_000_000
+
+# 시드 데이터 식별 조건 — 유저는 kakao_id 범위, 예약은 시드 유저가 만든 것
+# 팀/세션은 이름 접두어 (LIKE에서 _는 임의의 한 글자이므로 이스케이프한다)
+SEED_USERS = f"SELECT user_id FROM users WHERE kakao_id > {KAKAO_ID_BASE} AND kakao_id <= {KAKAO_ID_BASE + USER_COUNT}"
+SEED_FIRST_USER = f"SELECT min(user_id) FROM ({SEED_USERS}) seed_users"
+SEED_RESERVATIONS = f"SELECT reservation_id FROM reservations WHERE created_by IN ({SEED_USERS})"
+SEED_TEAMS = r"SELECT team_id FROM teams WHERE name LIKE 'load\_team\_%'"
+SEED_SESSIONS = r"SELECT session_id FROM sessions WHERE name LIKE 'load\_session\_%'"
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (kakao_id, nickname, affiliation)
+    SELECT {KAKAO_ID_BASE} + g, 'load_user_' || g, 'GAA'
+    FROM generate_series(1, {USER_COUNT}) g
+    """,
+    "INSERT INTO sessions (name) SELECT 'load_session_' || g FROM generate_series(1, 6) g",
+    f"INSERT INTO teams (name, description) SELECT 'load_team_' || g, '부하 테스트 팀' FROM generate_series(1, {TEAM_COUNT}) g",
+    f"""
+    INSERT INTO team_members (team_id, user_id, session_id)
+    SELECT t.team_id, u.user_id, s.session_id
+    FROM (SELECT team_id, row_number() OVER (ORDER BY team_id) AS rn FROM teams WHERE team_id IN ({SEED_TEAMS})) t
+    JOIN (SELECT user_id, row_number() OVER (ORDER BY user_id) AS rn FROM users WHERE user_id IN ({SEED_USERS})) u
+      ON u.rn BETWEEN (t.rn - 1) * 5 + 1 AND t.rn * 5
+    CROSS JOIN LATERAL (
+        SELECT session_id FROM sessions WHERE session_id IN ({SEED_SESSIONS})
+        ORDER BY session_id OFFSET u.rn % 6 LIMIT 1
+    ) s
+    """,
+    f"""
+    INSERT INTO reservations (created_by, title, reservation_date, start_time, end_time, location, max_participants)
+    SELECT ({SEED_FIRST_USER}) + (d.n * {RESERVATIONS_PER_DAY} + k) % {USER_COUNT},
+           'load_reservation_' || d.n || '_' || k,
+           d.day,
+           TIME '10:00' + k * INTERVAL '2 hour',
+           TIME '12:00' + k * INTERVAL '2 hour',
+           '합주실 A',
+           {HOT_MAX_PARTICIPANTS}
+    FROM (
+        SELECT day::date, row_number() OVER (ORDER BY day) AS n
+        FROM generate_series(DATE '{date(*MONTHS[0], 1)}', DATE '{date(*MONTHS[-1], 1)}' + INTERVAL '1 month' - INTERVAL '1 day', INTERVAL '1 day') day
+    ) d
+    CROSS JOIN generate_series(0, {RESERVATIONS_PER_DAY - 1}) k
+    """,
+    f"""
+    INSERT INTO reservation_participants (reservation_id, user_id)
+    SELECT r.reservation_id, ({SEED_FIRST_USER}) + (r.reservation_id * 7 + k) % {USER_COUNT}
+    FROM reservations r CROSS JOIN generate_series(1, 4) k
+    WHERE r.reservation_id IN ({SEED_RESERVATIONS})
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    UPDATE reservations r SET participant_count = (
+        SELECT count(*) FROM reservation_participants p
+        WHERE p.reservation_id = r.reservation_id AND p.status = 'confirmed'
+    )
+    WHERE r.reservation_id IN ({SEED_RESERVATIONS})
+    """,
+    f"""
+    INSERT INTO notices (author_id, title, content, created_at)
+    SELECT ({SEED_FIRST_USER}), 'load_notice_' || g,
+           repeat('합주 공지 내용입니다. ', 20), now() - g * INTERVAL '1 hour'
+    FROM generate_series(1, {NOTICE_COUNT}) g
+    """,
+]
+
+# FK 순서대로 시드 데이터 삭제 (시드 유저가 만든 예약/공지, 시드 유저의 참가/세션 기록, 시드 팀/세션)
+CLEANUP_SQL = [
+    f"""
+    DELETE FROM reservation_participants
+    WHERE reservation_id IN ({SEED_RESERVATIONS}) OR user_id IN ({SEED_USERS})
+    """,
+    f"DELETE FROM reservations WHERE reservation_id IN ({SEED_RESERVATIONS})",
+    f"DELETE FROM notices WHERE author_id IN ({SEED_USERS})",
+    f"DELETE FROM team_members WHERE team_id IN ({SEED_TEAMS}) OR user_id IN ({SEED_USERS})",
+    f"DELETE FROM teams WHERE team_id IN ({SEED_TEAMS})",
+    f"DELETE FROM user_sessions WHERE user_id IN ({SEED_USERS})",
+    f"DELETE FROM sessions WHERE session_id IN ({SEED_SESSIONS})",
+    f"DELETE FROM users WHERE user_id IN ({SEED_USERS})",
+]
+
+
+def confirm_database(confirmed: str | None):
+    """시드 데이터를 넣고 지우기 전에, --confirm-db로 적은 이름이 실제 대상 DB와 같은지 확인한다."""
+    target = make_url(settings.database_url)
+    if confirmed != target.database:
+        raise SystemExit(
+            f"대상 DB {target.database!r}에 시드 데이터를 넣고 삭제합니다. "
+            f"운영 DB가 아닌지 확인한 뒤 --confirm-db {target.database} 를 붙여 실행하세요."
+        )
+
+
+def kakao_stub(request: httpx.Request) -> httpx.Response:
+    """카카오 토큰/유저 정보 API 스텁 — 인가코드 = 시드 유저 번호"""
+    if request.url.path == "/oauth/token":
+        code = dict(httpx.QueryParams(request.content.decode()))["code"]
+        return httpx.Response(200, json={"access_token": f"stub-{code}"})
+    if request.url.path == "/v2/user/me":
+        n = int(request.headers["Authorization"].rsplit("-", 1)[1])
+        return httpx.Response(
+            200,
+            json={"id": KAKAO_ID_BASE + n, "kakao_account": {"profile": {"nickname": f"load_user_{n}"}}},
+        )
+    return httpx.Response(404)
+
+
+class Scenario:
+    """시드 데이터 id와 토큰을 들고 엔드포인트별 요청을 만든다."""
+
+    def __init__(self, ids: dict):
+        self.user_ids = ids["user_ids"]
+        self.team_ids = ids["team_ids"]
+        self.reservation_ids = ids["reservation_ids"]
+        self.hot_reservation_ids = self.reservation_ids[:HOT_RESERVATIONS]
+        self.tokens = {user_id: {"Authorization": f"Bearer {create_access_token(user_id)}"} for user_id in self.user_ids}
+        self.notice_cursors: list[str] = []
+
+    def headers(self) -> dict:
+        return self.tokens[random.choice(self.user_ids)]
+
+    async def month_calendar(self, client: httpx.AsyncClient) -> httpx.Response:
+        year, month = random.choice(MONTHS)
+        return await client.get("/api/reservations/", params={"year": year, "month": month}, headers=self.headers())
+
+    async def reservation_detail(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(f"/api/reservations/{random.choice(self.reservation_ids)}", headers=self.headers())
+
+    async def participate(self, client: httpx.AsyncClient) -> httpx.Response:
+        reservation_id = random.choice(self.hot_reservation_ids)
+        return await client.post(f"/api/reservations/{reservation_id}/participate", headers=self.headers())
+
+    async def cancel(self, client: httpx.AsyncClient) -> httpx.Response:
+        reservation_id = random.choice(self.hot_reservation_ids)
+        return await client.delete(f"/api/reservations/{reservation_id}/participate", headers=self.headers())
+
+    async def notices_page(self, client: httpx.AsyncClient) -> httpx.Response:
+        params = {"size": 20}
+        if self.notice_cursors and random.random() < 0.5:
+            params["cursor"] = random.choice(self.notice_cursors)
+        response = await client.get("/api/notices/", params=params, headers=self.headers())
+        next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if next_cursor and len(self.notice_cursors) < 20:
+            self.notice_cursors.append(next_cursor)
+        return response
+
+    async def team_detail(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(f"/api/teams/{random.choice(self.team_ids)}", headers=self.headers())
+
+    async def kakao_login(self, client: httpx.AsyncClient) -> httpx.Response:
+        n = random.randint(1, USER_COUNT)
+        return await client.post("/api/auth/kakao/login", json={"code": str(n), "redirect_uri": "http://stub"})
+
+
+# (이름, 메서드, 가중치, 성공으로 볼 상태 코드) — 참가/취소는 정원/중복 거절(400, 404)도 정상 응답
+ENDPOINTS = [
+    ("GET /reservations (month)", Scenario.month_calendar, 30, {200}),
+    ("GET /reservations/{id}", Scenario.reservation_detail, 20, {200}),
+    ("POST /reservations/{id}/participate", Scenario.participate, 10, {201, 400}),
+    ("DELETE /reservations/{id}/participate", Scenario.cancel, 10, {204, 404}),
+    ("GET /notices", Scenario.notices_page, 15, {200}),
+    ("GET /teams/{id}", Scenario.team_detail, 10, {200}),
+    ("POST /auth/kakao/login", Scenario.kakao_login, 5, {200}),
+]
+
+
+async def seed() -> dict:
+    async with engine.begin() as conn:
+        for sql in CLEANUP_SQL:
+            await conn.execute(text(sql))
+        for sql in SEED_SQL:
+            await conn.execute(text(sql))
+        await conn.execute(text("ANALYZE"))
+
+        async def ids(sql: str) -> list[int]:
+            return list((await conn.execute(text(sql))).scalars())
+
+        return {
+            "user_ids": await ids(f"{SEED_USERS} ORDER BY user_id"),
+            "team_ids": await ids(f"{SEED_TEAMS} ORDER BY team_id"),
+            "reservation_ids": await ids(f"{SEED_RESERVATIONS} ORDER BY reservation_id"),
+        }
+
+
+async def cleanup():
+    async with engine.begin() as conn:
+        for sql in CLEANUP_SQL:
+            await conn.execute(text(sql))
+
+
+async def worker(client: httpx.AsyncClient, scenario: Scenario, deadline: float, samples: dict):
+    names = [name for name, *_ in ENDPOINTS]
+    weights = [weight for _, _, weight, _ in ENDPOINTS]
+    handlers = {name: (method, ok) for name, method, _, ok in ENDPOINTS}
+
+    while time.perf_counter() < deadline:
+        name = random.choices(names, weights)[0]
+        method, ok = handlers[name]
+        # ASGITransport는 같은 컨텍스트에서 앱을 실행하므로 요청 미들웨어의 집계가 여기에도 더해진다
+        with collect_queries() as queries:
+            start = time.perf_counter()
+            try:
+                response = await method(scenario, client)
+                succeeded = response.status_code in ok
+            except Exception:
+                succeeded = False
+            elapsed = time.perf_counter() - start
+        samples[name].append((elapsed, queries.count, succeeded))
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: dict, duration: float) -> dict:
+    endpoints = {}
+    for name, *_ in ENDPOINTS:
+        rows = samples.get(name)
+        if not rows:
+            continue
+        latencies = sorted(elapsed * 1000 for elapsed, _, _ in rows)
+        endpoints[name] = {
+            "requests": len(rows),
+            "errors": sum(1 for *_, succeeded in rows if not succeeded),
+            "rps": round(len(rows) / duration, 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "queries_per_request": round(statistics.fmean(queries for _, queries, _ in rows), 2),
+        }
+    return endpoints
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(endpoints: dict, previous: dict | None):
+    """결과 표 출력 — previous(이전 결과 JSON)가 있으면 엔드포인트별 차이도 출력한다."""
+    header = f"{'endpoint':<40}{'req':>7}{'err':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>7}"
+    print(header)
+    print("-" * len(header))
+    for name, row in endpoints.items():
+        print(
+            f"{name:<40}{row['requests']:>7}{row['errors']:>6}{row['rps']:>9.1f}"
+            f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['queries_per_request']:>7.1f}"
+        )
+        before = previous["endpoints"].get(name) if previous else None
+        if before:
+            label = f"  vs {previous.get('revision') or 'previous'}"
+            print(
+                f"{label:<53}{row['rps'] - before['rps']:>+9.1f}{row['p50_ms'] - before['p50_ms']:>+9.2f}"
+                f"{row['p95_ms'] - before['p95_ms']:>+9.2f}{row['p99_ms'] - before['p99_ms']:>+9.2f}"
+                f"{row['queries_per_request'] - before['queries_per_request']:>+7.1f}"
+            )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="GAA ERP API 부하 테스트")
+    parser.add_argument("-c", "--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("-d", "--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--seed", type=int, default=1, help="요청 순서 난수 시드")
+    parser.add_argument("-o", "--output", type=Path, help="결과 JSON 경로 (기본: load_test_results/<시각>_<커밋>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--keep-data", action="store_true", help="끝난 뒤 시드 데이터를 지우지 않는다")
+    parser.add_argument("--confirm-db", metavar="NAME", help="대상 DB 이름 (DATABASE_URL의 DB와 같아야 실행된다)")
+    args = parser.parse_args()
+    confirm_database(args.confirm_db)
+
+    random.seed(args.seed)
+    # lifespan의 start_client()는 이미 있는 클라이언트를 그대로 쓴다
+    kakao._client = httpx.AsyncClient(transport=httpx.MockTransport(kakao_stub))
+
+    ids = await seed()
+    scenario = Scenario(ids)
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+                warmup = defaultdict(list)
+                deadline = time.perf_counter() + args.warmup
+                await asyncio.gather(*(worker(client, scenario, deadline, warmup) for _ in range(args.concurrency)))
+
+                samples = defaultdict(list)
+                started = time.perf_counter()
+                deadline = started + args.duration
+                await asyncio.gather(*(worker(client, scenario, deadline, samples) for _ in range(args.concurrency)))
+                duration = time.perf_counter() - started
+
+                # lifespan 종료 시 engine.dispose()가 호출되므로 그 전에 읽는다
+                pool = pool_status()
+    finally:
+        if not args.keep_data:
+            await cleanup()
+        await engine.dispose()
+
+    endpoints = summarize(samples, duration)
+    total = sum(row["requests"] for row in endpoints.values())
+    result = {
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "concurrency": args.concurrency,
+        "duration_seconds": round(duration, 2),
+        "total_requests": total,
+        "total_rps": round(total / duration, 2),
+        "endpoints": endpoints,
+        "db_pool": pool,
+        "caches": all_cache_stats(),
+    }
+
+    previous = json.loads(args.compare.read_text()) if args.compare else None
+
+    print(f"\n{total} requests in {duration:.1f}s ({result['total_rps']} req/s), concurrency {args.concurrency}\n")
+    print_report(endpoints, previous)
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}_{result['revision'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())